@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
@@ -9,6 +10,22 @@ from typing import List, Dict, Any, Optional
 from delve.state import Doc
 
 
+def stable_doc_id(content: str, index: int) -> str:
+    """Build a document ID for a record that has none.
+
+    The ID is derived from the record's position and content, so loading the
+    same data again yields the same IDs and cached responses stay valid.
+
+    Args:
+        content: Text content of the document
+        index: Position of the record in the source
+
+    Returns:
+        str: Hex digest identifying the document
+    """
+    return hashlib.blake2b(f"{index}\n{content}".encode(), digest_size=8).hexdigest()
+
+
 @dataclass
 class DataSourceConfig:
     """Configuration for a data source.
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import uuid
 from pathlib import Path
 from typing import List, Optional
 
 import pandas as pd
 
-from delve.adapters.base import DataSource, DataSourceConfig
+from delve.adapters.base import DataSource, DataSourceConfig, stable_doc_id
 from delve.state import Doc
 
 
@@ -31,7 +30,8 @@ class CSVAdapter(DataSource):
         Args:
             file_path: Path to the CSV file
             text_column: Name of the column containing text content
-            id_column: Optional column name for document IDs (generates UUIDs if not provided)
+            id_column: Optional column name for document IDs (derived from
+                row position and content if not provided)
             encoding: File encoding (default: utf-8)
         """
         config = DataSourceConfig(
@@ -105,13 +105,7 @@ class CSVAdapter(DataSource):
 
         # Convert to Doc objects
         documents = []
-        for idx, row in df.iterrows():
-            # Get ID from column or generate UUID
-            if self.id_column:
-                doc_id = str(row[self.id_column])
-            else:
-                doc_id = str(uuid.uuid4())
-
+        for position, (_, row) in enumerate(df.iterrows()):
             # Get text content
             content = str(row[self.text_column])
 
@@ -119,6 +113,12 @@ class CSVAdapter(DataSource):
             if not content or content.strip() == "" or content == "nan":
                 continue
 
+            # Get ID from column or derive a stable one from the row
+            if self.id_column:
+                doc_id = str(row[self.id_column])
+            else:
+                doc_id = stable_doc_id(content, position)
+
             doc = Doc(id=doc_id, content=content)
             documents.append(doc)
 
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import List, Optional
 
 import pandas as pd
 
-from delve.adapters.base import DataSource, DataSourceConfig
+from delve.adapters.base import DataSource, DataSourceConfig, stable_doc_id
 from delve.state import Doc
 
 
@@ -28,7 +27,8 @@ class DataFrameAdapter(DataSource):
         Args:
             df: Pandas DataFrame containing the data
             text_column: Name of the column containing text content
-            id_column: Optional column name for document IDs (generates UUIDs if not provided)
+            id_column: Optional column name for document IDs (derived from
+                row position and content if not provided)
         """
         config = DataSourceConfig(
             source_type="dataframe",
@@ -83,13 +83,7 @@ class DataFrameAdapter(DataSource):
 
         # Convert to Doc objects
         documents = []
-        for idx, row in self.df.iterrows():
-            # Get ID from column or generate UUID
-            if self.id_column:
-                doc_id = str(row[self.id_column])
-            else:
-                doc_id = str(uuid.uuid4())
-
+        for position, (_, row) in enumerate(self.df.iterrows()):
             # Get text content
             content = str(row[self.text_column])
 
@@ -97,6 +91,12 @@ class DataFrameAdapter(DataSource):
             if not content or content.strip() == "" or content == "nan":
                 continue
 
+            # Get ID from column or derive a stable one from the row
+            if self.id_column:
+                doc_id = str(row[self.id_column])
+            else:
+                doc_id = stable_doc_id(content, position)
+
             doc = Doc(id=doc_id, content=content)
             documents.append(doc)
 
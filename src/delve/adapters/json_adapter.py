@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import json
-import uuid
 from pathlib import Path
 from typing import List, Optional, Any
 
 from jsonpath_ng import parse
 
-from delve.adapters.base import DataSource, DataSourceConfig
+from delve.adapters.base import DataSource, DataSourceConfig, stable_doc_id
 from delve.state import Doc
 
 
@@ -33,7 +32,8 @@ class JSONAdapter(DataSource):
         Args:
             file_path: Path to the JSON or JSONL file
             text_field: Name of the field containing text content
-            id_field: Optional field name for document IDs (generates UUIDs if not provided)
+            id_field: Optional field name for document IDs (derived from
+                item position and content if not provided)
             json_path: Optional JSONPath expression to extract data (e.g., "$.messages[*]")
             encoding: File encoding (default: utf-8)
         """
@@ -172,18 +172,10 @@ class JSONAdapter(DataSource):
             if not isinstance(item, dict):
                 # If item is a string, use it directly as content
                 if isinstance(item, str):
-                    doc = Doc(id=str(uuid.uuid4()), content=item)
+                    doc = Doc(id=stable_doc_id(item, idx), content=item)
                     documents.append(doc)
                 continue
 
-            # Extract ID
-            if self.id_field:
-                doc_id = self._extract_field(item, self.id_field)
-                if not doc_id:
-                    doc_id = str(uuid.uuid4())
-            else:
-                doc_id = str(uuid.uuid4())
-
             # Extract text content
             content = self._extract_field(item, self.text_field)
 
@@ -191,6 +183,11 @@ class JSONAdapter(DataSource):
             if not content or content.strip() == "" or content == "None":
                 continue
 
+            # Extract ID, deriving a stable one when the item has none
+            doc_id = self._extract_field(item, self.id_field) if self.id_field else None
+            if not doc_id:
+                doc_id = stable_doc_id(content, idx)
+
             doc = Doc(id=doc_id, content=content)
             documents.append(doc)
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 from datetime import datetime, timedelta
-from typing import List, Union, Dict, Optional
+from typing import Iterable, List, Union, Dict, Optional, Tuple
 
 from langsmith import Client
 from langsmith.schemas import Run
@@ -131,6 +131,37 @@ def run_to_doc(run: Run, max_length: int = 500) -> Doc:
     )
 
 
+def process_runs(
+    runs: Iterable[Run],
+    *,
+    sample: Optional[int] = None,
+) -> Tuple[List[Doc], int]:
+    """Convert runs to documents in a single pass.
+
+    Each run is converted as it is consumed, so `runs` can be a lazy
+    iterator. When `sample` is set, reservoir sampling keeps a uniform
+    random sample of at most `sample` documents.
+
+    Args:
+        runs: Runs to convert
+        sample: Optional number of documents to keep
+
+    Returns:
+        Tuple of (documents, total number of runs consumed)
+    """
+    documents: List[Doc] = []
+    num_runs = 0
+    for run in runs:
+        num_runs += 1
+        if sample is None or len(documents) < sample:
+            documents.append(run_to_doc(run))
+        else:
+            slot = random.randrange(num_runs)
+            if slot < sample:
+                documents[slot] = run_to_doc(run)
+    return documents, num_runs
+
+
 class LangSmithAdapter(DataSource):
     """Adapter for loading data from LangSmith projects.
 
@@ -218,31 +249,25 @@ class LangSmithAdapter(DataSource):
         # Calculate lookback time
         delta_days = datetime.now() - timedelta(days=self.days)
 
-        # Retrieve runs
+        # Stream runs so the raw run payloads are never all held in memory
         try:
-            runs = list(
+            documents, num_runs = process_runs(
                 self.client.list_runs(
                     project_name=self.project_name,
                     filter=self.filter_expr,
                     start_time=delta_days,
                     select=["inputs", "outputs"],
                     limit=self.max_runs,
-                )
+                ),
+                sample=self.sample_size,
             )
         except Exception as e:
             raise Exception(f"Failed to retrieve runs from LangSmith: {e}")
 
-        if not runs:
+        if not num_runs:
             raise ValueError(
                 f"No runs found in LangSmith project '{self.project_name}' "
                 f"for the last {self.days} days"
             )
 
-        # Convert runs to documents
-        documents = [run_to_doc(run) for run in runs]
-
-        # Apply sampling if specified
-        if self.sample_size is not None and self.sample_size < len(documents):
-            documents = random.sample(documents, self.sample_size)
-
         return documents
@@ -54,6 +54,13 @@ class Delve:
         embedding_model: str = "text-embedding-3-large",
         classifier_confidence_threshold: float = 0.0,
         max_num_clusters: int = 5,
+        label_concurrency: int = 16,
+        parallel_updates: bool = False,
+        update_concurrency: int = 4,
+        minibatches_per_update: int = 1,
+        cache_enabled: bool = False,
+        cache_dir: str = "./.delve_cache",
+        seed: Optional[int] = None,
     ):
         """Initialize Delve client.
 
@@ -72,12 +79,30 @@ class Delve:
             console: Optional Console instance. If not provided, one is created
                 based on verbosity level.
             predefined_taxonomy: Pre-defined taxonomy to use instead of discovery.
-                Can be a file path (JSON/CSV) or a list of dicts with 'id', 'name', 'description'.
+                Can be a file path (JSON/JSONL/CSV) or a list of dicts with 'id', 'name', 'description'.
                 When provided, skips the discovery phase and directly labels documents.
             embedding_model: OpenAI embedding model for classifier training (default: text-embedding-3-large)
             classifier_confidence_threshold: Minimum confidence for classifier predictions.
                 Documents below threshold are labeled by LLM (default: 0.0 = no fallback).
             max_num_clusters: Maximum number of clusters/categories to generate (default: 5).
+            label_concurrency: Maximum number of concurrent LLM requests when
+                labeling documents (default: 16).
+            parallel_updates: Process all minibatches in parallel and merge the
+                resulting taxonomies before review, instead of refining the
+                taxonomy sequentially (default: False).
+            update_concurrency: Maximum number of concurrent taxonomy update
+                requests when parallel_updates is enabled (default: 4).
+            minibatches_per_update: Number of minibatches sent to the LLM in
+                each taxonomy update call. Higher values mean fewer update
+                calls with larger prompts (default: 1).
+            cache_enabled: Cache summary, taxonomy generation, update, and
+                review responses and document embeddings on disk so repeated runs
+                over the same data skip identical API calls (default: False).
+            cache_dir: Directory for cached responses (default: ./.delve_cache).
+            seed: Seed for document sampling and minibatch shuffling. With
+                cache_enabled, rerunning an interrupted run with the same seed
+                replays every completed LLM call from the cache and resumes
+                at the first call that did not finish (default: None).
         """
         self.config = Configuration(
             model=model,
@@ -93,6 +118,13 @@ class Delve:
             embedding_model=embedding_model,
             classifier_confidence_threshold=classifier_confidence_threshold,
             max_num_clusters=max_num_clusters,
+            label_concurrency=label_concurrency,
+            parallel_updates=parallel_updates,
+            update_concurrency=update_concurrency,
+            minibatches_per_update=minibatches_per_update,
+            cache_enabled=cache_enabled,
+            cache_dir=cache_dir,
+            seed=seed,
         )
         self.console = self.config.get_console()
 
@@ -257,17 +289,18 @@ class Delve:
         start_time = time.time()
 
         # Debug: Show full configuration
-        self.console.debug("=" * 50)
-        self.console.debug("Delve Configuration:")
-        self.console.debug(f"  Model: {self.config.model}")
-        self.console.debug(f"  Fast LLM: {self.config.fast_llm}")
-        self.console.debug(f"  Sample size: {self.config.sample_size}")
-        self.console.debug(f"  Batch size: {self.config.batch_size}")
-        self.console.debug(f"  Max clusters: {self.config.max_num_clusters}")
-        self.console.debug(f"  Embedding model: {self.config.embedding_model}")
-        self.console.debug(f"  Output dir: {self.config.output_dir}")
-        self.console.debug(f"  Use case: {self.config.use_case}")
-        self.console.debug("=" * 50)
+        if self.console.is_debug:
+            self.console.debug("=" * 50)
+            self.console.debug("Delve Configuration:")
+            self.console.debug(f"  Model: {self.config.model}")
+            self.console.debug(f"  Fast LLM: {self.config.fast_llm}")
+            self.console.debug(f"  Sample size: {self.config.sample_size}")
+            self.console.debug(f"  Batch size: {self.config.batch_size}")
+            self.console.debug(f"  Max clusters: {self.config.max_num_clusters}")
+            self.console.debug(f"  Embedding model: {self.config.embedding_model}")
+            self.console.debug(f"  Output dir: {self.config.output_dir}")
+            self.console.debug(f"  Use case: {self.config.use_case}")
+            self.console.debug("=" * 50)
 
         # 0. Validate API keys before starting
         # Check for OpenAI key if sample_size > 0 (might need embeddings for classifier)
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Annotated, Optional, List, Union, Dict
 
 from langchain_core.runnables import RunnableConfig, ensure_config
 
-from delve.console import Console, NullConsole, Verbosity
+from delve.console import Console, Verbosity
 
 if TYPE_CHECKING:
     pass
@@ -87,7 +87,7 @@ class Configuration:
         default=None,
         metadata={
             "description": "Pre-defined taxonomy to use instead of discovering one. "
-            "Can be a file path (JSON/CSV) or a list of category dicts with 'id', 'name', 'description'."
+            "Can be a file path (JSON/JSONL/CSV) or a list of category dicts with 'id', 'name', 'description'."
         },
     )
 
@@ -114,12 +114,72 @@ class Configuration:
         },
     )
 
+    label_concurrency: int = field(
+        default=16,
+        metadata={
+            "description": "Maximum number of concurrent LLM requests when labeling documents."
+        },
+    )
+
+    parallel_updates: bool = field(
+        default=False,
+        metadata={
+            "description": "Update the taxonomy against all minibatches in parallel and merge the "
+            "results, instead of refining it one minibatch at a time."
+        },
+    )
+
+    update_concurrency: int = field(
+        default=4,
+        metadata={
+            "description": "Maximum number of concurrent taxonomy update requests when "
+            "parallel_updates is enabled."
+        },
+    )
+
+    minibatches_per_update: int = field(
+        default=1,
+        metadata={
+            "description": "Number of minibatches sent to the LLM in each taxonomy update call. "
+            "Higher values mean fewer update calls, each with more documents."
+        },
+    )
+
+    cache_enabled: bool = field(
+        default=False,
+        metadata={
+            "description": "Cache summary, taxonomy generation, update, and review responses "
+            "and document embeddings on disk, so identical requests are not re-sent."
+        },
+    )
+
+    seed: Optional[int] = field(
+        default=None,
+        metadata={
+            "description": "Seed for document sampling, minibatch shuffling, and review sampling. "
+            "Set it together with cache_enabled to make reruns reproducible and resumable."
+        },
+    )
+
+    cache_dir: str = field(
+        default="./.delve_cache",
+        metadata={
+            "description": "Directory for cached taxonomy responses when cache_enabled is set."
+        },
+    )
+
     def __post_init__(self) -> None:
-        """Initialize console based on verbosity."""
+        """Initialize console based on verbosity and validate settings."""
         # Create console if not provided
         if self.console is None:
             self.console = Console(self.verbosity)
 
+        # Limits below 1 would deadlock the workers or stall the update loop
+        for name in ("label_concurrency", "update_concurrency", "minibatches_per_update"):
+            value = getattr(self, name)
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+
     def get_console(self) -> Console:
         """Get the console instance, creating one if needed.
 
@@ -169,5 +229,12 @@ class Configuration:
             "embedding_model": self.embedding_model,
             "classifier_confidence_threshold": self.classifier_confidence_threshold,
             "max_num_clusters": self.max_num_clusters,
+            "label_concurrency": self.label_concurrency,
+            "parallel_updates": self.parallel_updates,
+            "update_concurrency": self.update_concurrency,
+            "minibatches_per_update": self.minibatches_per_update,
+            "cache_enabled": self.cache_enabled,
+            "cache_dir": self.cache_dir,
+            "seed": self.seed,
             "console": self.console,
         }
@@ -37,6 +37,15 @@ class Console:
         self._rich_console: Optional[RichConsole] = None
         self._current_status: Optional[Status] = None
 
+    @property
+    def is_debug(self) -> bool:
+        """Whether debug output is enabled.
+
+        Use this to skip building expensive debug messages that would
+        otherwise be discarded.
+        """
+        return self.verbosity >= Verbosity.DEBUG
+
     def _get_rich(self) -> "RichConsole":
         """Lazily initialize and return the rich console."""
         if self._rich_console is None:
@@ -110,7 +119,7 @@ class Console:
         Args:
             message: Debug message to display.
         """
-        if self.verbosity >= Verbosity.DEBUG:
+        if self.is_debug:
             self._get_rich().print(f"[dim]{message}[/dim]")
 
     def info(self, message: str) -> None:
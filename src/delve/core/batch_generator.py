@@ -1,19 +1,24 @@
 """Node for generating minibatches from documents."""
 
 import random
-from typing import List, Dict
+from typing import List, Optional
 from langchain_core.runnables import RunnableConfig
 
 from delve.state import State
 from delve.configuration import Configuration
 
 
-def _create_batches(indices: List[int], batch_size: int) -> List[List[int]]:
+def _create_batches(
+    indices: List[int],
+    batch_size: int,
+    rng: Optional[random.Random] = None,
+) -> List[List[int]]:
     """Create batches of document indices.
     
     Args:
         indices: List of document indices to batch
         batch_size: Size of each batch
+        rng: Random generator used to pad the last batch
         
     Returns:
         List of batches, where each batch is a list of document indices
@@ -31,7 +36,7 @@ def _create_batches(indices: List[int], batch_size: int) -> List[List[int]]:
     if leftovers:
         last_batch = indices[num_full_batches * batch_size :]
         elements_to_add = batch_size - leftovers
-        last_batch += random.sample(indices, elements_to_add)
+        last_batch += (rng or random).sample(indices, elements_to_add)
         batches.append(last_batch)
 
     return batches
@@ -50,11 +55,12 @@ async def generate_minibatches(state: State, config: RunnableConfig) -> dict:
     configuration = Configuration.from_runnable_config(config)
     
     # Create and shuffle document indices
+    rng = random.Random(configuration.seed)
     indices = list(range(len(state.documents)))
-    random.shuffle(indices)
+    rng.shuffle(indices)
 
     # Generate batches
-    batches = _create_batches(indices, configuration.batch_size)
+    batches = _create_batches(indices, configuration.batch_size, rng)
 
     return {
         "minibatches": batches,
@@ -1,22 +1,333 @@
 """Node for loading data using adapters."""
 
+import copy
+import csv
+import io
 import json
+import os
 import random
-from pathlib import Path
-from typing import List, Union, Dict, Optional
-from langchain_core.runnables import RunnableConfig
+from collections import namedtuple
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Union
 
-import pandas as pd
+from langchain_core.runnables import RunnableConfig
 
-from delve.state import State, Doc
 from delve.configuration import Configuration
+from delve.state import State
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# Bound decode of a single shared decoder; skips json.loads' per-call type
+# and encoding checks, which add up when parsing JSONL line by line.
+_DECODE = json.JSONDecoder().decode
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes with orjson when installed, else the stdlib parser.
+
+    orjson parses straight from bytes without a separate text decode and is
+    several times faster on large files (`pip install delve-taxonomy[speedups]`).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return _DECODE(raw.decode('utf-8'))
+
+
+# Files at least this large are parsed with pyarrow when it is installed;
+# below it, pyarrow's setup cost outweighs the faster native parse.
+PYARROW_CSV_MIN_BYTES = 64 * 1024
+
+_TAXONOMY_COLUMNS = ('id', 'name', 'description')
+_REQUIRED_FIELDS = frozenset(_TAXONOMY_COLUMNS)
+
+# Read buffer for streaming CSV parsing; larger than the 8 KB default so
+# multi-MB files take far fewer read() calls.
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+def _validate_taxonomy_item(item: Dict[str, str]) -> None:
+    """Raise if a taxonomy item is not a dict with 'id', 'name', 'description'."""
+    if not isinstance(item, dict):
+        raise ValueError(
+            "Each taxonomy item must be a dict with 'id', 'name', and 'description' "
+            f"fields. Got: {item!r}"
+        )
+    if not _REQUIRED_FIELDS.issubset(item):
+        raise ValueError(
+            "Each taxonomy item must have 'id', 'name', and 'description' fields. "
+            f"Got: {item.keys()}"
+        )
+
+
+def _check_csv_columns(columns: Iterable[str]) -> None:
+    """Raise if a CSV header lacks any of the required taxonomy columns."""
+    missing = _REQUIRED_FIELDS.difference(columns)
+    if missing:
+        raise ValueError(
+            f"CSV must have columns: {sorted(_REQUIRED_FIELDS)}, "
+            f"missing {sorted(missing)}. Got: {list(columns)}"
+        )
+
+
+def _load_taxonomy_csv_pyarrow(path: str) -> List[Dict[str, str]]:
+    """Parse a taxonomy CSV with pyarrow's multithreaded native reader."""
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            # Keep values as strings, matching the csv module path
+            column_types={col: pa.string() for col in _TAXONOMY_COLUMNS},
+        ),
+    )
+    _check_csv_columns(table.schema.names)
+    return table.select(list(_TAXONOMY_COLUMNS)).to_pylist()
+
+
+def _parse_taxonomy_csv(lines: Iterable[str]) -> List[Dict[str, str]]:
+    """Parse taxonomy CSV text into dicts with 'id', 'name', 'description'."""
+    reader = csv.reader(lines)
+    header = next(reader, [])
+    _check_csv_columns(header)
+    # Resolve column positions once instead of building a dict per row
+    id_idx = header.index('id')
+    name_idx = header.index('name')
+    desc_idx = header.index('description')
+    width = max(id_idx, name_idx, desc_idx) + 1
+    items = []
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            raise ValueError(
+                f"CSV row {reader.line_num} has {len(row)} fields, "
+                f"expected at least {width}: {row}"
+            )
+        items.append({
+            "id": row[id_idx],
+            "name": row[name_idx],
+            "description": row[desc_idx],
+        })
+    return items
+
+
+def _load_taxonomy_csv(path: str) -> List[Dict[str, str]]:
+    """Parse a taxonomy CSV file, using pyarrow for large files."""
+    if pa_csv is not None and os.path.getsize(path) >= PYARROW_CSV_MIN_BYTES:
+        return _load_taxonomy_csv_pyarrow(path)
+
+    # utf-8-sig drops the byte order mark Excel writes, which would otherwise
+    # end up in the first header name
+    with open(path, newline='', encoding='utf-8-sig', buffering=_READ_BUFFER_SIZE) as f:
+        return _parse_taxonomy_csv(f)
+
+
+def _load_taxonomy_json_lazy(raw: bytes) -> Any:
+    """Parse taxonomy JSON with simdjson, materializing only required fields.
+
+    simdjson builds a lazy document over the raw bytes, so extra per-category
+    fields (metadata, examples) are never turned into Python objects. This
+    wins on files with such sidecar data; for plain files orjson is faster,
+    so simdjson is only used when installed (`pip install delve-taxonomy[simdjson]`).
+    """
+    # A parser's documents are invalidated on reuse, so use one per file
+    data = simdjson.Parser().parse(raw)
+    # Handle both direct list and nested structure
+    if isinstance(data, simdjson.Object) and 'taxonomy' in data:
+        data = data['taxonomy']
+    if isinstance(data, simdjson.Object) and 'clusters' in data:
+        data = data['clusters']
+    if not isinstance(data, simdjson.Array):
+        return data.as_dict() if isinstance(data, simdjson.Object) else data
+
+    items = []
+    for item in data:
+        if not isinstance(item, simdjson.Object) or not _REQUIRED_FIELDS.issubset(item.keys()):
+            _validate_taxonomy_item(_materialize_simdjson(item))
+        items.append({
+            "id": _materialize_simdjson(item['id']),
+            "name": _materialize_simdjson(item['name']),
+            "description": _materialize_simdjson(item['description']),
+        })
+    return items
+
+
+def _materialize_simdjson(value: Any) -> Any:
+    """Convert a simdjson value to the object the stdlib parser would return.
+
+    Scalars already come back as Python values; only containers are lazy.
+    """
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _parse_taxonomy_json(raw: bytes) -> Any:
+    """Parse taxonomy JSON, unwrapping 'taxonomy'/'clusters' keys."""
+    if simdjson is not None:
+        return _load_taxonomy_json_lazy(raw)
 
+    data = _loads_json(raw)
+    # Handle both direct list and nested structure
+    if isinstance(data, dict) and 'taxonomy' in data:
+        data = data['taxonomy']
+    if isinstance(data, dict) and 'clusters' in data:
+        data = data['clusters']
+    return data
 
-def _load_predefined_taxonomy(taxonomy_input: Union[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
-    """Load taxonomy from file or dict.
+
+def _load_taxonomy_json(path: str) -> Any:
+    """Parse a taxonomy JSON file."""
+    with open(path, 'rb') as f:
+        return _parse_taxonomy_json(f.read())
+
+
+def _parse_taxonomy_jsonl(lines: Iterable[bytes]) -> List[Dict[str, str]]:
+    """Parse JSONL holding one category object per line.
+
+    Lines are parsed as they are read, so only one raw line is held in
+    memory at a time rather than the whole document.
+    """
+    items = []
+    for line in lines:
+        if not line.strip():
+            continue
+        item = _loads_json(line)
+        _validate_taxonomy_item(item)
+        items.append(item)
+    return items
+
+
+def _load_taxonomy_jsonl(path: str) -> List[Dict[str, str]]:
+    """Parse a taxonomy JSONL file."""
+    with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+        return _parse_taxonomy_jsonl(f)
+
+
+# Taxonomy file parsers keyed by lowercase file suffix
+_LOADERS: Dict[str, Callable[[str], Any]] = {
+    '.json': _load_taxonomy_json,
+    '.jsonl': _load_taxonomy_jsonl,
+    '.csv': _load_taxonomy_csv,
+}
+
+
+# Memoized taxonomies are held as immutable rows, which take roughly a third
+# of the memory of the equivalent dicts and cannot be mutated by callers.
+_TaxonomyRow = namedtuple('_TaxonomyRow', _TAXONOMY_COLUMNS)
+
+
+def _freeze_taxonomy(data: Any) -> Any:
+    """Validate a parsed taxonomy and pack its categories into rows."""
+    if not isinstance(data, list):
+        return data
+    rows = []
+    for item in data:
+        _validate_taxonomy_item(item)
+        rows.append(_TaxonomyRow(item['id'], item['name'], item['description']))
+    return tuple(rows)
+
+
+def _thaw_taxonomy(data: Any) -> Any:
+    """Expand frozen taxonomy rows into fresh category dicts for callers."""
+    if isinstance(data, tuple):
+        return [
+            {"id": row.id, "name": row.name, "description": row.description}
+            for row in data
+        ]
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=32)
+def _load_taxonomy_file(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a taxonomy file, memoized on its path, mtime and size.
+
+    Any edit to the file changes the key, so stale results are never served.
+    Results are frozen rows; expand them with `_thaw_taxonomy`.
+    """
+    suffix = os.path.splitext(path_str)[1]
+    loader = _LOADERS.get(suffix.lower())
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {suffix}. Use .json, .jsonl or .csv")
+    return _freeze_taxonomy(loader(path_str))
+
+
+def _sniff_format(raw: bytes) -> str:
+    """Guess whether taxonomy content is JSON, JSONL or CSV.
+
+    Content starting with '{' is JSONL when its first line is a complete
+    object and more lines follow; a pretty-printed JSON object's first line
+    does not parse on its own.
+    """
+    stripped = raw.lstrip()
+    head = stripped[:1]
+    if head == b'[':
+        return 'json'
+    if head != b'{':
+        return 'csv'
+
+    lines = [line for line in stripped.splitlines() if line.strip()]
+    if len(lines) > 1:
+        try:
+            if isinstance(_loads_json(lines[0]), dict):
+                return 'jsonl'
+        except ValueError:
+            pass
+    return 'json'
+
+
+def _load_taxonomy_stream(stream: IO, file_format: Optional[str] = None) -> Any:
+    """Parse a taxonomy from an open file-like object.
+
+    Args:
+        stream: Binary or text file-like object
+        file_format: One of 'json', 'jsonl' or 'csv'. If omitted, it is
+            sniffed from the content: '[' or a JSON object is JSON, one
+            object per line is JSONL and anything else is CSV.
+    """
+    raw = stream.read()
+    if isinstance(raw, str):
+        raw = raw.encode('utf-8')
+
+    if file_format is None:
+        file_format = _sniff_format(raw)
+    file_format = file_format.lower().lstrip('.')
+
+    if file_format == 'json':
+        return _parse_taxonomy_json(raw)
+    if file_format == 'jsonl':
+        return _parse_taxonomy_jsonl(raw.splitlines())
+    if file_format == 'csv':
+        return _parse_taxonomy_csv(io.StringIO(raw.decode('utf-8-sig'), newline=''))
+    raise ValueError(f"Unsupported file format: {file_format}. Use .json, .jsonl or .csv")
+
+
+def _load_predefined_taxonomy(
+    taxonomy_input: Union[str, IO, List[Dict[str, str]]],
+    file_format: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """Load taxonomy from file, file-like object or dict.
 
     Args:
-        taxonomy_input: Either a list of taxonomy dicts or a file path (JSON/CSV)
+        taxonomy_input: A list of taxonomy dicts, a file path (JSON/JSONL/CSV),
+            or a file-like object with the file contents
+        file_format: Format of a file-like `taxonomy_input` ('json', 'jsonl' or
+            'csv'). Sniffed from the content when omitted.
 
     Returns:
         List of taxonomy dictionaries with 'id', 'name', 'description'
@@ -24,51 +335,30 @@ def _load_predefined_taxonomy(taxonomy_input: Union[str, List[Dict[str, str]]])
     Raises:
         ValueError: If taxonomy format is invalid or file cannot be read
     """
+    # Fast path for in-memory taxonomies: already in the right shape, so
+    # only validate the required fields, with no I/O, parsing or copying
     if isinstance(taxonomy_input, list):
-        # Already in correct format - validate it has required fields
+        issubset = _REQUIRED_FIELDS.issubset
         for item in taxonomy_input:
-            if not all(k in item for k in ['id', 'name', 'description']):
-                raise ValueError(
-                    "Each taxonomy item must have 'id', 'name', and 'description' fields. "
-                    f"Got: {item.keys()}"
-                )
+            if not isinstance(item, dict) or not issubset(item):
+                _validate_taxonomy_item(item)
         return taxonomy_input
 
+    if hasattr(taxonomy_input, 'read'):
+        # Validate and normalize the same way as file input
+        data = _load_taxonomy_stream(taxonomy_input, file_format)
+        return _thaw_taxonomy(_freeze_taxonomy(data))
+
     if isinstance(taxonomy_input, str):
         # Load from file
-        path = Path(taxonomy_input)
-
-        if not path.exists():
-            raise ValueError(f"Taxonomy file not found: {path}")
-
-        if path.suffix == '.json':
-            with open(path) as f:
-                data = json.load(f)
-                # Handle both direct list and nested structure
-                if isinstance(data, dict) and 'taxonomy' in data:
-                    data = data['taxonomy']
-                if isinstance(data, dict) and 'clusters' in data:
-                    data = data['clusters']
-                return data
-
-        elif path.suffix == '.csv':
-            df = pd.read_csv(path)
-            required_cols = {'id', 'name', 'description'}
-            if not required_cols.issubset(df.columns):
-                raise ValueError(
-                    f"CSV must have columns: {required_cols}. "
-                    f"Got: {set(df.columns)}"
-                )
-            return [
-                {
-                    "id": str(row['id']),
-                    "name": str(row['name']),
-                    "description": str(row['description'])
-                }
-                for _, row in df.iterrows()
-            ]
-        else:
-            raise ValueError(f"Unsupported file format: {path.suffix}. Use .json or .csv")
+        try:
+            stat = os.stat(taxonomy_input)
+        except FileNotFoundError:
+            raise ValueError(f"Taxonomy file not found: {taxonomy_input}")
+
+        return _thaw_taxonomy(
+            _load_taxonomy_file(taxonomy_input, stat.st_mtime_ns, stat.st_size)
+        )
 
     raise ValueError(
         f"Invalid taxonomy format. Expected list of dicts or file path, got {type(taxonomy_input)}"
@@ -102,7 +392,7 @@ async def load_data(state: State, config: RunnableConfig) -> dict:
 
     if sample_size and sample_size < len(all_docs):
         # Random sample
-        sampled_docs = random.sample(all_docs, sample_size)
+        sampled_docs = random.Random(configuration.seed).sample(all_docs, sample_size)
         status_message = f"Sampled {sample_size} documents from {len(all_docs)} total documents"
     else:
         # Use all documents
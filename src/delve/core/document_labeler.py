@@ -6,17 +6,26 @@ Uses a hybrid approach:
 3. Returns all labeled documents
 """
 
+import functools
+import os
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
+import numpy as np
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableConfig
 from langchain_openai import OpenAIEmbeddings
 
 from delve.state import State, Doc
-from delve.utils import load_chat_model
+from delve.utils import CachedEmbeddings, load_chat_model
 from delve.configuration import Configuration
 from delve.prompts import LABELER_PROMPT
-from delve.core.classifier import train_classifier, predict_with_classifier
+from delve.core.classifier import (
+    to_embedding_array,
+    train_classifier,
+    predict_with_classifier,
+)
+
+_CATEGORY_ID_RE = re.compile(r"<category_id>\s*(\d+)\s*</category_id>")
 
 
 def _get_category_name_by_id(category_id: str, taxonomy: List[Dict[str, str]]) -> str:
@@ -44,57 +53,83 @@ def _get_category_name_by_id(category_id: str, taxonomy: List[Dict[str, str]]) -
     )
 
 
+def _to_doc(doc: Union[Doc, Dict[str, Any]]) -> Doc:
+    """Copy a document into the Doc shape the labeler returns.
+
+    The copy is owned by the labeler, so its category can be set in place
+    without touching the caller's documents.
+    """
+    if isinstance(doc, Doc):
+        return Doc(id=doc.id, content=doc.content, summary=doc.summary or "")
+    return Doc(id=doc["id"], content=doc["content"], summary=doc.get("summary") or "")
+
+
+async def _embed_unique(encoder, contents: List[str]) -> np.ndarray:
+    """Embed texts as a float16 array, sending each distinct text only once."""
+    unique_index: Dict[str, int] = {}
+    membership = [unique_index.setdefault(content, len(unique_index)) for content in contents]
+    unique_embeddings = to_embedding_array(
+        await encoder.aembed_documents(list(unique_index))
+    )
+    return unique_embeddings[membership]
+
+
 def _parse_labels(output_text: str, console=None) -> Dict[str, str]:
     """Parse the generated category ID from LLM output."""
     # Extract category ID from <category_id>N</category_id> tags
-    id_matches = re.findall(
-        r"<category_id>\s*(\d+)\s*</category_id>",
-        output_text,
-        re.DOTALL,
-    )
+    match = _CATEGORY_ID_RE.search(output_text)
 
-    if not id_matches:
-        # Fallback: try to find any number in the output
+    if match is None:
         if console:
             console.warning(f"No <category_id> tag found in output: {output_text[:200]}")
         return {"category_id": None}
 
-    if len(id_matches) > 1:
-        if console:
-            console.warning(f"Multiple category IDs found: {id_matches}, using first one")
-
-    return {"category_id": id_matches[0]}
-
+    # Only look for further matches when there is somewhere to report them
+    if console and _CATEGORY_ID_RE.search(output_text, match.end()):
+        id_matches = _CATEGORY_ID_RE.findall(output_text)
+        console.warning(f"Multiple category IDs found: {id_matches}, using first one")
 
-def _format_taxonomy(clusters: List[Dict[str, str]]) -> str:
-    """Format taxonomy clusters as XML."""
+    return {"category_id": match.group(1)}
 
-    xml = "<cluster_table>\n"
 
+def _build_taxonomy_xml(clusters: List[Dict[str, str]]) -> str:
+    """Build the cluster table XML for a taxonomy."""
     if clusters and isinstance(clusters[0], list):
         clusters = clusters[0]
 
     if isinstance(clusters, dict):
         clusters = [clusters]
 
+    parts = ["<cluster_table>\n"]
     for cluster in clusters:
-        xml += "  <cluster>\n"
         if isinstance(cluster, dict):
-            xml += f'    <id>{cluster["id"]}</id>\n'
-            xml += f'    <name>{cluster["name"]}</name>\n'
-            xml += f'    <description>{cluster["description"]}</description>\n'
+            cluster_id = cluster["id"]
+            name = cluster["name"]
+            description = cluster["description"]
         else:
-            xml += f'    <id>{getattr(cluster, "id", "")}</id>\n'
-            xml += f'    <name>{getattr(cluster, "name", "")}</name>\n'
-            xml += f'    <description>{getattr(cluster, "description", "")}</description>\n'
-        xml += "  </cluster>\n"
-    xml += "</cluster_table>"
-    return xml
+            cluster_id = getattr(cluster, "id", "")
+            name = getattr(cluster, "name", "")
+            description = getattr(cluster, "description", "")
+        parts.append(
+            "  <cluster>\n"
+            f"    <id>{cluster_id}</id>\n"
+            f"    <name>{name}</name>\n"
+            f"    <description>{description}</description>\n"
+            "  </cluster>\n"
+        )
+    parts.append("</cluster_table>")
+    return "".join(parts)
 
 
 def _setup_classification_chain(configuration: Configuration):
     """Set up the chain for document labeling."""
-    model = load_chat_model(configuration.fast_llm)
+    return _build_classification_chain(configuration.fast_llm)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_classification_chain(model_name: str):
+    """Build the labeling chain, cached per model name."""
+    model = load_chat_model(model_name)
 
     return (
         LABELER_PROMPT
@@ -113,7 +148,7 @@ async def label_documents(
     Strategy:
     1. LLM labels sampled documents (state.documents)
     2. If more documents exist in state.all_documents:
-       - Train RandomForest classifier on embeddings
+       - Train a classifier on embeddings
        - Use classifier to label remaining documents
     3. Return all labeled documents
     """
@@ -121,55 +156,70 @@ async def label_documents(
     console = configuration.get_console()
 
     # Debug: Show configuration
-    console.debug(f"Configuration: model={configuration.model}, fast_llm={configuration.fast_llm}")
-    console.debug(f"Sample size: {configuration.sample_size}, Batch size: {configuration.batch_size}")
-    console.debug(f"Documents to label: {len(state.documents)}, Total documents: {len(state.all_documents)}")
+    if console.is_debug:
+        console.debug(f"Configuration: model={configuration.model}, fast_llm={configuration.fast_llm}")
+        console.debug(f"Sample size: {configuration.sample_size}, Batch size: {configuration.batch_size}")
+        console.debug(f"Documents to label: {len(state.documents)}, Total documents: {len(state.all_documents)}")
 
     # Get latest taxonomy
-    latest_clusters = None
-    for clusters in reversed(state.clusters):
-        if isinstance(clusters, list) and clusters:
-            latest_clusters = clusters
-            break
-
-    if not latest_clusters and state.clusters:
-        latest_clusters = [state.clusters[-1]] if isinstance(state.clusters[-1], dict) else state.clusters[-1]
+    latest_clusters = state.latest_clusters
 
     if not latest_clusters:
         raise ValueError("No valid clusters found in state")
 
     # Debug: Show taxonomy categories
-    console.debug(f"Taxonomy has {len(latest_clusters)} categories:")
-    for cat in latest_clusters:
-        console.debug(f"  [{cat['id']}] {cat['name']}")
+    if console.is_debug:
+        console.debug(f"Taxonomy has {len(latest_clusters)} categories:")
+        for cat in latest_clusters:
+            console.debug(f"  [{cat['id']}] {cat['name']}")
+
+    # Summarized documents arrive as dicts; normalize once up front
+    docs = [_to_doc(doc) for doc in state.documents]
 
     # Step 1: Label sampled documents with LLM
     labeling_chain = _setup_classification_chain(configuration)
 
-    # Process documents with progress tracking
-    labeled_results = []
-    with console.progress(len(state.documents), "Labeling documents with LLM") as advance:
-        for doc in state.documents:
-            result = await labeling_chain.ainvoke(
-                {
-                    "content": doc["content"] if isinstance(doc, dict) else doc.content,
-                    "taxonomy": _format_taxonomy(latest_clusters),
-                }
-            )
-            labeled_results.append(result)
+    # Taxonomy XML is the same for every document, so format it once
+    taxonomy_xml = _build_taxonomy_xml(latest_clusters)
+
+    # Documents with identical content get the same label, so only send
+    # each distinct content to the LLM once and fan the result back out
+    content_to_unique: Dict[str, int] = {}
+    doc_to_unique: List[int] = []
+    inputs = []
+    for doc in docs:
+        content = doc.content
+        unique_idx = content_to_unique.get(content)
+        if unique_idx is None:
+            unique_idx = content_to_unique[content] = len(inputs)
+            inputs.append({"content": content, "taxonomy": taxonomy_xml})
+        doc_to_unique.append(unique_idx)
+
+    duplicate_count = len(docs) - len(inputs)
+    if duplicate_count:
+        console.debug(f"Skipping {duplicate_count} documents with duplicate content")
+
+    # Label documents concurrently, keeping results in document order
+    unique_results = [None] * len(inputs)
+    with console.progress(len(inputs), "Labeling documents with LLM") as advance:
+        async for idx, result in labeling_chain.abatch_as_completed(
+            inputs,
+            config={"max_concurrency": configuration.label_concurrency},
+        ):
+            unique_results[idx] = result
             advance()
+    labeled_results = [unique_results[idx] for idx in doc_to_unique]
 
-    # Create labeled Doc objects for sampled documents
-    # Map category IDs to category names
-    llm_labeled_docs = []
+    # Map category IDs to category names on the labeler-owned docs
+    llm_labeled_docs = docs
     warnings_list = []
     other_count = 0
 
-    for doc, category_result in zip(state.documents, labeled_results):
+    for doc, category_result in zip(docs, labeled_results):
         category_id = category_result.get("category_id")
 
         if category_id is None:
-            warning_msg = f"No category ID returned for doc {doc['id'] if isinstance(doc, dict) else doc.id}, using 'Other'"
+            warning_msg = f"No category ID returned for doc {doc.id}, using 'Other'"
             console.warning(warning_msg)
             warnings_list.append(warning_msg)
             category_name = "Other"
@@ -184,17 +234,11 @@ async def label_documents(
                 category_name = "Other"
                 other_count += 1
 
-        llm_labeled_docs.append(Doc(
-            id=doc["id"] if isinstance(doc, dict) else doc.id,
-            content=doc["content"] if isinstance(doc, dict) else doc.content,
-            summary=doc.get("summary", "") if isinstance(doc, dict) else (doc.summary or ""),
-            explanation=None,
-            category=category_name
-        ))
+        doc.category = category_name
 
     # Step 2: Check if we need to label more documents
     total_docs = len(state.all_documents)
-    sampled_docs = len(state.documents)
+    sampled_docs = len(docs)
 
     if sampled_docs >= total_docs:
         # All documents were sampled and labeled by LLM
@@ -216,14 +260,20 @@ async def label_documents(
 
     # Initialize embeddings encoder
     encoder = OpenAIEmbeddings(model=configuration.embedding_model)
+    if configuration.cache_enabled:
+        encoder = CachedEmbeddings(
+            encoder,
+            configuration.embedding_model,
+            os.path.join(configuration.cache_dir, "embeddings"),
+        )
 
     # Generate embeddings for LLM-labeled documents (training set)
     with console.status("Generating embeddings for training set..."):
         training_contents = [doc.content for doc in llm_labeled_docs]
-        training_embeddings = await encoder.aembed_documents(training_contents)
+        training_embeddings = await _embed_unique(encoder, training_contents)
 
     # Train classifier
-    with console.status("Training RandomForest classifier..."):
+    with console.status("Training classifier..."):
         model, index_to_category, metrics = train_classifier(
             llm_labeled_docs,
             training_embeddings,
@@ -235,44 +285,34 @@ async def label_documents(
         f"Classifier trained - Test F1: {metrics['test_f1']:.3f}, "
         f"Test Accuracy: {metrics['test_accuracy']:.3f}"
     )
-    console.debug(f"Classifier metrics detail:")
-    console.debug(f"  Train Accuracy: {metrics['train_accuracy']:.3f}, Train F1: {metrics['train_f1']:.3f}")
-    console.debug(f"  Test Accuracy: {metrics['test_accuracy']:.3f}, Test F1: {metrics['test_f1']:.3f}")
+    if console.is_debug:
+        console.debug(f"Classifier metrics detail:")
+        console.debug(f"  Train Accuracy: {metrics['train_accuracy']:.3f}, Train F1: {metrics['train_f1']:.3f}")
+        console.debug(f"  Test Accuracy: {metrics['test_accuracy']:.3f}, Test F1: {metrics['test_f1']:.3f}")
 
     # Get unlabeled documents (those not in the sample)
     sampled_ids = {doc.id for doc in llm_labeled_docs}
     unlabeled_docs = [
-        doc for doc in state.all_documents
-        if (doc["id"] if isinstance(doc, dict) else doc.id) not in sampled_ids
+        _to_doc(doc) for doc in state.all_documents
+        if (doc.id if isinstance(doc, Doc) else doc["id"]) not in sampled_ids
     ]
 
     # Generate embeddings for unlabeled documents
     with console.status(f"Generating embeddings for {len(unlabeled_docs)} documents..."):
-        unlabeled_contents = [
-            doc["content"] if isinstance(doc, dict) else doc.content
-            for doc in unlabeled_docs
-        ]
-        unlabeled_embeddings = await encoder.aembed_documents(unlabeled_contents)
+        unlabeled_contents = [doc.content for doc in unlabeled_docs]
+        unlabeled_embeddings = await _embed_unique(encoder, unlabeled_contents)
 
     # Predict categories
     with console.status("Classifying with trained model..."):
         predicted_categories = predict_with_classifier(
             model,
             unlabeled_embeddings,
-            index_to_category
+            index_to_category,
         )
 
-    # Create Doc objects for classifier-labeled documents
-    classifier_labeled_docs = [
-        Doc(
-            id=doc["id"] if isinstance(doc, dict) else doc.id,
-            content=doc["content"] if isinstance(doc, dict) else doc.content,
-            summary=doc.get("summary", "") if isinstance(doc, dict) else (doc.summary or ""),
-            explanation=None,
-            category=category
-        )
-        for doc, category in zip(unlabeled_docs, predicted_categories)
-    ]
+    for doc, category in zip(unlabeled_docs, predicted_categories):
+        doc.category = category
+    classifier_labeled_docs = unlabeled_docs
 
     # Combine all labeled documents
     all_labeled_docs = llm_labeled_docs + classifier_labeled_docs
@@ -4,12 +4,11 @@ import re
 from typing import Dict, List, Any
 from uuid import uuid4
 
-from langsmith import Client
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableLambda, RunnablePassthrough, RunnableConfig
 
-from delve.state import State
-from delve.utils import load_chat_model, parse_taxa, invoke_taxonomy_chain
+from delve.state import State, Doc
+from delve.utils import load_chat_model, pull_prompt, with_response_cache
 from delve.configuration import Configuration
 
 
@@ -87,8 +86,6 @@ async def generate_summaries(
 ) -> dict:
     """Generate summaries for a collection of documents."""
 
-    client = Client()
-
     configuration = Configuration.from_runnable_config(config)
 
     # Initialize the model and prompt
@@ -106,15 +103,19 @@ async def generate_summaries(
             ) from e
         raise
     
-    summary_prompt = client.pull_prompt("wfh/tnt-llm-summary-generation").partial(
+    summary_prompt = pull_prompt("wfh/tnt-llm-summary-generation").partial(
         summary_length=20, explanation_length=30
     )
 
     # Create the summary chain
+    llm_chain = model | StrOutputParser()
+    if configuration.cache_enabled:
+        llm_chain = with_response_cache(
+            llm_chain, configuration.fast_llm, configuration.cache_dir
+        )
     summary_llm_chain = (
         summary_prompt 
-        | model 
-        | StrOutputParser()
+        | llm_chain
     ).with_config(run_name="GenerateSummary")
 
     summary_chain = summary_llm_chain | _parse_summary
@@ -137,6 +138,8 @@ async def generate_summaries(
             if "id" not in doc:
                 doc["id"] = str(uuid4())
             processed_docs.append(doc)
+        elif isinstance(doc, Doc):
+            processed_docs.append({"id": doc.id, "content": doc.content})
         else:
             processed_docs.append({"id": str(uuid4()), "content": str(doc)})
 
@@ -1,10 +1,13 @@
 """Node for generating taxonomies from document batches."""
 
+import functools
+from typing import Optional
+
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableConfig
 
 from delve.state import State
-from delve.utils import load_chat_model, parse_taxa, invoke_taxonomy_chain
+from delve.utils import load_chat_model, parse_taxa, invoke_taxonomy_chain, with_response_cache
 from delve.configuration import Configuration
 from delve.prompts import TAXONOMY_GENERATION_PROMPT
 
@@ -12,21 +15,31 @@ def _setup_taxonomy_chain(configuration: Configuration, feedback: str, use_case:
     """Set up the chain for taxonomy generation."""
     # Use the configured use_case, or fallback to default if empty
     effective_use_case = use_case if use_case else "Generate the taxonomy that can be used to label the user intent in the conversation."
+    cache_dir = configuration.cache_dir if configuration.cache_enabled else None
+    return _build_taxonomy_chain(configuration.model, feedback, effective_use_case, cache_dir)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_taxonomy_chain(
+    model_name: str,
+    feedback: str,
+    use_case: str,
+    cache_dir: Optional[str] = None,
+):
+    """Build the taxonomy generation chain, cached per model and prompt inputs."""
     taxonomy_prompt = TAXONOMY_GENERATION_PROMPT.partial(
-        use_case=effective_use_case,
+        use_case=use_case,
         feedback=feedback,
     )
     # Create the chain - use main model for taxonomy generation (core reasoning task)
     model = load_chat_model(
-        configuration.model,
+        model_name,
     )
+    llm_chain = model | StrOutputParser() | parse_taxa
+    if cache_dir:
+        llm_chain = with_response_cache(llm_chain, model_name, cache_dir)
 
-    return (
-        taxonomy_prompt
-        | model
-        | StrOutputParser()
-        | parse_taxa
-    ).with_config(run_name="GenerateTaxonomy")
+    return (taxonomy_prompt | llm_chain).with_config(run_name="GenerateTaxonomy")
 
 
 async def generate_taxonomy(
@@ -1,39 +1,49 @@
 """Node for reviewing and finalizing taxonomies."""
 
+import functools
 import random
+from typing import Optional
+
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableConfig
 
 from delve.state import State
-from delve.utils import load_chat_model, parse_taxa, invoke_taxonomy_chain
+from delve.utils import (
+    load_chat_model,
+    parse_taxa,
+    invoke_taxonomy_chain,
+    pull_prompt,
+    with_response_cache,
+)
 from delve.configuration import Configuration
-from langsmith import Client
 
 
 def _setup_review_chain(configuration: Configuration):
     """Set up the chain for taxonomy review.
     
     Args:
-        model_name: Name of the model to use
-        max_tokens: Maximum tokens for model response
+        configuration: Run configuration
         
     Returns:
         Chain for reviewing and parsing taxonomies
     """
-    client = Client()
+    cache_dir = configuration.cache_dir if configuration.cache_enabled else None
+    return _build_review_chain(configuration.fast_llm, cache_dir)
+
 
+@functools.lru_cache(maxsize=8)
+def _build_review_chain(model_name: str, cache_dir: Optional[str] = None):
+    """Build the review chain, cached per model name and cache directory."""
     # Initialize the prompt
-    review_prompt = client.pull_prompt("wfh/tnt-llm-taxonomy-review")
+    review_prompt = pull_prompt("wfh/tnt-llm-taxonomy-review")
 
     # Create the chain
-    model = load_chat_model(configuration.fast_llm)
+    model = load_chat_model(model_name)
+    llm_chain = model | StrOutputParser() | parse_taxa
+    if cache_dir:
+        llm_chain = with_response_cache(llm_chain, model_name, cache_dir)
 
-    return (
-        review_prompt
-        | model
-        | StrOutputParser()
-        | parse_taxa
-    ).with_config(run_name="ReviewTaxonomy")
+    return (review_prompt | llm_chain).with_config(run_name="ReviewTaxonomy")
 
 
 async def review_taxonomy(
@@ -58,9 +68,9 @@ async def review_taxonomy(
 
     # Create random sample of documents
     batch_size = configuration.batch_size
-    indices = list(range(len(state.documents)))
-    random.shuffle(indices)
-    sample_indices = indices[:batch_size]
+    num_docs = len(state.documents)
+    rng = random.Random(configuration.seed)
+    sample_indices = rng.sample(range(num_docs), min(batch_size, num_docs))
 
     # Review taxonomy using sampled documents
     return await invoke_taxonomy_chain(
@@ -1,38 +1,50 @@
 """Node for updating taxonomies based on new document batches."""
 
+import asyncio
+import functools
+from typing import Dict, List, Optional
+
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnableConfig
 
 from delve.state import State
-from delve.utils import load_chat_model, parse_taxa, invoke_taxonomy_chain
+from delve.utils import (
+    load_chat_model,
+    parse_taxa,
+    invoke_taxonomy_chain,
+    pack_minibatches,
+    pull_prompt,
+    with_response_cache,
+)
 from delve.configuration import Configuration
-from langsmith import Client
 
 
 def _setup_update_chain(configuration: Configuration):
     """Set up the chain for taxonomy updates.
     
     Args:
-        model_name: Name of the model to use
-        max_tokens: Maximum tokens for model response
+        configuration: Run configuration
         
     Returns:
         Chain for updating and parsing taxonomies
     """
-    # Initialize the promptclient = Client()
-    client = Client()
+    cache_dir = configuration.cache_dir if configuration.cache_enabled else None
+    return _build_update_chain(configuration.fast_llm, cache_dir)
 
-    update_prompt = client.pull_prompt("wfh/tnt-llm-taxonomy-update")
+
+@functools.lru_cache(maxsize=8)
+def _build_update_chain(model_name: str, cache_dir: Optional[str] = None):
+    """Build the update chain, cached per model name and cache directory."""
+    # Initialize the prompt
+    update_prompt = pull_prompt("wfh/tnt-llm-taxonomy-update")
 
     # Create the chain
-    model = load_chat_model(configuration.fast_llm)
+    model = load_chat_model(model_name)
+    llm_chain = model | StrOutputParser() | parse_taxa
+    if cache_dir:
+        llm_chain = with_response_cache(llm_chain, model_name, cache_dir)
 
-    return (
-        update_prompt
-        | model
-        | StrOutputParser()
-        | parse_taxa
-    ).with_config(run_name="UpdateTaxonomy")
+    return (update_prompt | llm_chain).with_config(run_name="UpdateTaxonomy")
 
 
 async def update_taxonomy(
@@ -55,13 +67,96 @@ async def update_taxonomy(
     # Set up the chain
     update_chain = _setup_update_chain(configuration)
 
-    # Determine which minibatch to use
-    which_mb = len(state.clusters) % len(state.minibatches)
+    # Determine which minibatches to use; the first one generated the taxonomy
+    per_update = configuration.minibatches_per_update
+    which_mb = (1 + (len(state.clusters) - 1) * per_update) % len(state.minibatches)
 
     # Update taxonomy using the next batch
     return await invoke_taxonomy_chain(
         update_chain,
         state,
         config,
-        state.minibatches[which_mb]
+        pack_minibatches(state.minibatches, which_mb, per_update)
     )
+
+
+async def update_taxonomy_parallel(
+    state: State,
+    config: RunnableConfig
+) -> dict:
+    """Update the generated taxonomy against all remaining minibatches at once.
+
+    Every update starts from the generated taxonomy. At most
+    `update_concurrency` requests are in flight at a time, and the revised
+    taxonomies are returned together in minibatch order. If any update
+    fails, the outstanding ones are cancelled and the error is raised.
+
+    Args:
+        state: Current application state
+        config: Configuration for the run
+
+    Returns:
+        dict: Updated state fields with one revised taxonomy per minibatch
+    """
+    configuration = Configuration.from_runnable_config(config)
+    update_chain = _setup_update_chain(configuration)
+    semaphore = asyncio.Semaphore(configuration.update_concurrency)
+
+    async def _update(minibatch: List[int]) -> dict:
+        async with semaphore:
+            return await invoke_taxonomy_chain(update_chain, state, config, minibatch)
+
+    per_update = configuration.minibatches_per_update
+    batches = [
+        pack_minibatches(state.minibatches, start, per_update)
+        for start in range(1, len(state.minibatches), per_update)
+    ]
+    tasks = [asyncio.ensure_future(_update(batch)) for batch in batches]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # gather leaves the other updates running when one fails; cancel them
+        # so a failed run stops spending tokens
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return {
+        "clusters": [result["clusters"][0] for result in results],
+        "status": [
+            f"Updated taxonomy with {len(state.minibatches) - 1} minibatches in parallel.."
+        ],
+    }
+
+
+def merge_taxonomies(state: State) -> dict:
+    """Merge the taxonomies produced by parallel minibatch updates.
+
+    Categories are combined by name (case-insensitive, first occurrence
+    wins) and renumbered from 1. The merged table may exceed the cluster
+    limit; the review step consolidates it.
+
+    Args:
+        state: Current application state
+
+    Returns:
+        dict: Updated state fields with the merged taxonomy
+    """
+    # clusters[0] is the generated base taxonomy, the rest are branch results
+    branch_taxonomies = state.clusters[1:]
+
+    merged: Dict[str, Dict[str, str]] = {}
+    for taxonomy in branch_taxonomies:
+        for cluster in taxonomy:
+            merged.setdefault(cluster["name"].strip().lower(), cluster)
+
+    clusters = [
+        {"id": str(i), "name": cluster["name"], "description": cluster["description"]}
+        for i, cluster in enumerate(merged.values(), start=1)
+    ]
+
+    return {
+        "clusters": [clusters],
+        "status": [f"Merged {len(branch_taxonomies)} taxonomies into {len(clusters)} categories.."],
+    }
@@ -1,7 +1,12 @@
-"""Define the taxonomy generation graph structure."""
+"""Define the taxonomy generation graph structure.
+
+The graph is compiled without a checkpointer. If you compile it with one,
+invoke it with `durability="sync"` (or `"exit"`): the default async
+durability keeps every pending checkpoint, each holding a full copy of the
+document-heavy State, alive until the run finishes.
+"""
 
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from delve.configuration import Configuration
 from delve.state import InputState, State
@@ -9,11 +14,11 @@ from delve.core.data_loader import load_data
 from delve.core.summarizer import generate_summaries
 from delve.core.batch_generator import generate_minibatches
 from delve.core.taxonomy_generator import generate_taxonomy
-from delve.core.taxonomy_updater import update_taxonomy
+from delve.core.taxonomy_updater import update_taxonomy, update_taxonomy_parallel, merge_taxonomies
 from delve.core.taxonomy_reviewer import review_taxonomy
 from delve.core.document_labeler import label_documents
 from delve.core.results_saver import save_results
-from delve.routing import should_review, should_discover_taxonomy
+from delve.routing import should_review, should_discover_taxonomy, route_taxonomy_updates
 
 # Create the graph
 builder = StateGraph(State, input=InputState, config_schema=Configuration)
@@ -24,6 +29,8 @@ builder.add_node("summarize", generate_summaries)
 builder.add_node("get_minibatches", generate_minibatches)
 builder.add_node("generate_taxonomy", generate_taxonomy)
 builder.add_node("update_taxonomy", update_taxonomy)
+builder.add_node("update_taxonomy_parallel", update_taxonomy_parallel)
+builder.add_node("merge_taxonomies", merge_taxonomies)
 builder.add_node("review_taxonomy", review_taxonomy)
 builder.add_node("label_documents", label_documents)
 builder.add_node("save_results", save_results)
@@ -44,7 +51,16 @@ builder.add_conditional_edges(
 # Discovery flow edges
 builder.add_edge("summarize", "get_minibatches")
 builder.add_edge("get_minibatches", "generate_taxonomy")
-builder.add_edge("generate_taxonomy", "update_taxonomy")
+
+# Minibatch updates run sequentially by default, or fan out in parallel
+# and merge before review when parallel_updates is enabled
+builder.add_conditional_edges(
+    "generate_taxonomy",
+    route_taxonomy_updates,
+    ["update_taxonomy", "update_taxonomy_parallel", "review_taxonomy"],
+)
+builder.add_edge("update_taxonomy_parallel", "merge_taxonomies")
+builder.add_edge("merge_taxonomies", "review_taxonomy")
 
 # Review and labeling edges
 builder.add_edge("review_taxonomy", "label_documents")
@@ -7,10 +7,10 @@ from typing import List, Dict, Any, Union, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
-    from delve.state import Doc, State
+    from delve.state import Doc, DocTable, State
     from delve.configuration import Configuration
 else:
-    from delve.state import State
+    from delve.state import DocTable, State
 
 
 @dataclass
@@ -190,6 +190,14 @@ class DelveResult:
         self.export_paths = output_paths
         return output_paths
 
+    def to_doc_table(self) -> DocTable:
+        """Return the labeled documents in column-oriented form.
+
+        Useful for vectorized analysis of large results, e.g.
+        `result.to_doc_table().category_counts()`.
+        """
+        return DocTable.from_docs(self.labeled_documents)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -2,6 +2,9 @@
 
 from typing import Literal
 
+from langchain_core.runnables import RunnableConfig
+
+from delve.configuration import Configuration
 from delve.state import State
 
 
@@ -24,19 +27,52 @@ def should_discover_taxonomy(state: State) -> Literal["summarize", "label_docume
     return "summarize"
 
 
-def should_review(state: State) -> Literal["update_taxonomy", "review_taxonomy"]:
+def should_review(
+    state: State, config: RunnableConfig
+) -> Literal["update_taxonomy", "review_taxonomy"]:
     """Determine whether to continue updating or move to review.
 
-    Checks if all minibatches have been processed.
+    Checks if all minibatches have been processed. The first minibatch
+    generates the taxonomy and each update consumes `minibatches_per_update`
+    more.
 
     Args:
         state: Current state
+        config: Configuration for the run
 
     Returns:
         "update_taxonomy" if more batches to process, "review_taxonomy" if done
     """
+    per_update = Configuration.from_runnable_config(config).minibatches_per_update
     num_minibatches = len(state.minibatches)
-    num_revisions = len(state.clusters)
-    if num_revisions < num_minibatches:
+    num_updates = len(state.clusters) - 1
+    if 1 + num_updates * per_update < num_minibatches:
         return "update_taxonomy"
     return "review_taxonomy"
+
+
+def route_taxonomy_updates(
+    state: State, config: RunnableConfig
+) -> Literal["update_taxonomy", "update_taxonomy_parallel", "review_taxonomy"]:
+    """Determine how to process the remaining minibatches after generation.
+
+    By default the taxonomy is refined one minibatch at a time. With
+    `parallel_updates` enabled, all remaining minibatches are processed
+    concurrently by `update_taxonomy_parallel`.
+
+    Args:
+        state: Current state
+        config: Configuration for the run
+
+    Returns:
+        "update_taxonomy" for sequential updates, "update_taxonomy_parallel"
+        for parallel updates, or "review_taxonomy" if there is nothing to update
+    """
+    configuration = Configuration.from_runnable_config(config)
+    if not configuration.parallel_updates:
+        return "update_taxonomy"
+
+    if len(state.minibatches) < 2:
+        return "review_taxonomy"
+
+    return "update_taxonomy_parallel"
@@ -6,12 +6,18 @@ from dataclasses import dataclass, field
 from typing import Annotated, List, Optional, Dict
 import operator
 
+import numpy as np
+import pandas as pd
 from langgraph.managed import IsLastStep
 
 
-@dataclass
+@dataclass(slots=True)
 class Doc:
-    """Represents a document in the taxonomy generation process."""
+    """Represents a document in the taxonomy generation process.
+
+    Slotted to keep per-document memory low, since runs can hold tens of
+    thousands of these.
+    """
     id: str
     content: str
     summary: Optional[str] = None
@@ -19,6 +25,68 @@ class Doc:
     category: Optional[str] = None
 
 
+@dataclass
+class DocTable:
+    """Column-oriented view of a list of documents.
+
+    Each field is stored as one array, with categories as a pandas
+    Categorical, so analysis over many documents (counting, grouping,
+    filtering by category) runs vectorized instead of per Doc object.
+    """
+    ids: np.ndarray
+    contents: np.ndarray
+    summaries: np.ndarray
+    explanations: np.ndarray
+    categories: pd.Categorical
+
+    @classmethod
+    def from_docs(cls, docs: List[Doc]) -> DocTable:
+        """Build a table from Doc objects."""
+        def column(name: str) -> np.ndarray:
+            values = np.empty(len(docs), dtype=object)
+            values[:] = [getattr(doc, name) for doc in docs]
+            return values
+
+        return cls(
+            ids=column("id"),
+            contents=column("content"),
+            summaries=column("summary"),
+            explanations=column("explanation"),
+            categories=pd.Categorical([doc.category for doc in docs]),
+        )
+
+    def to_docs(self) -> List[Doc]:
+        """Convert the table back to Doc objects."""
+        categories = [
+            None if pd.isna(category) else category
+            for category in self.categories
+        ]
+        return [
+            Doc(
+                id=id_,
+                content=content,
+                summary=summary,
+                explanation=explanation,
+                category=category,
+            )
+            for id_, content, summary, explanation, category in zip(
+                self.ids, self.contents, self.summaries, self.explanations, categories
+            )
+        ]
+
+    def category_counts(self) -> Dict[str, int]:
+        """Count documents per category, most common first.
+
+        Uncategorized documents are not counted.
+        """
+        counts = pd.Series(self.categories).value_counts(sort=True)
+        return {category: int(count) for category, count in counts.items() if count}
+
+    def __len__(self) -> int:
+        """Return the number of documents in the table."""
+        return len(self.ids)
+
+
 @dataclass
 class InputState:
     """Defines the input state for the agent.
@@ -57,3 +125,18 @@ class State(InputState, OutputState):
     skipped_document_count: int = 0
     warnings: List[str] = field(default_factory=list)
 
+    @property
+    def latest_clusters(self) -> Optional[List[Dict]]:
+        """Return the most recent non-empty taxonomy revision, if any.
+
+        Older states may hold a bare cluster dict as the last entry; it is
+        wrapped in a list so callers always get a list of clusters.
+        """
+        clusters = self.clusters
+        for i in range(len(clusters) - 1, -1, -1):
+            revision = clusters[i]
+            if isinstance(revision, list) and revision:
+                return revision
+        if clusters and isinstance(clusters[-1], dict):
+            return [clusters[-1]]
+        return None
@@ -1,14 +1,24 @@
 """Utility & helper functions."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import re
-import random
-from typing import List, Optional, Dict, Any, Union, Sequence
-from langchain_core.runnables import Runnable, RunnableConfig
+from pathlib import Path
+from typing import List, Optional, Dict, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langsmith import Client
 
 from delve.state import Doc, State
 
@@ -108,9 +118,13 @@ def get_message_text(msg: BaseMessage) -> str:
         return "".join(txts).strip()
 
 
+@functools.lru_cache(maxsize=8)
 def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     """Load a chat model from a fully specified name.
 
+    Models are cached per name, so every node and graph step shares one
+    client (and its HTTP connection pool) instead of building a new one.
+
     Args:
         fully_specified_name (str): String in the format 'provider/model'.
         
@@ -152,6 +166,135 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
             ) from e
 
 
+@functools.cache
+def pull_prompt(prompt_name: str) -> ChatPromptTemplate:
+    """Pull a prompt from the LangSmith prompt hub.
+
+    Prompts are cached for the lifetime of the process, so repeated graph
+    steps don't pay a network round-trip for the same prompt.
+
+    Args:
+        prompt_name: Hub identifier, e.g. 'wfh/tnt-llm-taxonomy-update'.
+
+    Returns:
+        ChatPromptTemplate: The pulled prompt.
+    """
+    return Client().pull_prompt(prompt_name)
+
+
+def with_response_cache(chain: Runnable, model_name: str, cache_dir: str) -> Runnable:
+    """Wrap a model chain with an on-disk exact-match response cache.
+
+    Entries are keyed on the model name and the fully rendered prompt, so any
+    change to the prompt, taxonomy, or documents is a cache miss. The chain's
+    output must be JSON serializable.
+
+    Args:
+        chain: Chain that takes a rendered prompt, e.g. `model | parser`.
+        model_name: Name of the model the chain calls.
+        cache_dir: Directory where cached responses are stored.
+
+    Returns:
+        Runnable: The chain, served from the cache for repeated prompts.
+    """
+    directory = Path(cache_dir)
+
+    async def _cached(prompt_value: PromptValue, config: RunnableConfig):
+        key = hashlib.blake2b(
+            f"{model_name}\n{prompt_value.to_string()}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        path = directory / f"{key}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        result = await chain.ainvoke(prompt_value, config)
+
+        # Write then rename so a concurrent reader never sees a partial entry
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(result), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return result
+
+    return RunnableLambda(_cached)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that stores document vectors on disk.
+
+    Vectors are keyed by model name and text, so re-running on the same
+    documents only sends new or changed texts to the embedding API. They are
+    stored as float16, the precision the classifier works with.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, cache_dir: str):
+        """Initialize the cache.
+
+        Args:
+            embeddings: Embeddings client used on cache misses
+            model_name: Name of the embedding model, part of the cache key
+            cache_dir: Directory where vectors are stored
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, text: str) -> Path:
+        key = hashlib.blake2b(
+            f"{self.model_name}\n{text}".encode(), digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{key}.npy"
+
+    def _load(self, text: str) -> Optional[List[float]]:
+        try:
+            return np.load(self._path(text)).tolist()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _store(self, text: str, vector: List[float]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(text)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.asarray(vector, dtype=np.float16))
+        os.replace(tmp_path, path)
+
+    def _split(self, texts: List[str]):
+        vectors = [self._load(text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        return vectors, missing
+
+    def _fill(self, texts, vectors, missing, new_vectors) -> List[List[float]]:
+        for i, vector in zip(missing, new_vectors):
+            vectors[i] = vector
+            self._store(texts[i], vector)
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, calling the wrapped client only for cache misses."""
+        vectors, missing = self._split(texts)
+        if not missing:
+            return vectors
+        new_vectors = self.embeddings.embed_documents([texts[i] for i in missing])
+        return self._fill(texts, vectors, missing, new_vectors)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, calling the wrapped client only for cache misses."""
+        # Cache reads and writes run in a worker thread to keep the event loop free
+        vectors, missing = await asyncio.to_thread(self._split, texts)
+        if not missing:
+            return vectors
+        new_vectors = await self.embeddings.aembed_documents([texts[i] for i in missing])
+        return await asyncio.to_thread(self._fill, texts, vectors, missing, new_vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query. Queries are not cached."""
+        return self.embeddings.embed_query(text)
+
+
 def to_xml(
     data: Union[Dict, List],
     tag_name: str,
@@ -272,13 +415,13 @@ def format_docs(docs: List[Doc]) -> str:
     Returns:
         str: XML formatted document summaries
     """
-    xml_table = "<conversations>\n"
+    parts = ["<conversations>\n"]
     for doc in docs:
         doc_id = doc["id"] if isinstance(doc, dict) else doc.id
         doc_summary = doc.get("summary", "") if isinstance(doc, dict) else (doc.summary or "")
-        xml_table += f'<conv_summ id={doc_id}>{doc_summary}</conv_summ>\n'
-    xml_table += "</conversations>"
-    return xml_table
+        parts.append(f'<conv_summ id={doc_id}>{doc_summary}</conv_summ>\n')
+    parts.append("</conversations>")
+    return "".join(parts)
 
 
 def format_taxonomy(clusters: List[Dict[str, str]]) -> str:
@@ -290,15 +433,31 @@ def format_taxonomy(clusters: List[Dict[str, str]]) -> str:
     Returns:
         str: XML formatted taxonomy
     """
-    xml = "<cluster_table>\n"
+    parts = ["<cluster_table>\n"]
     for label in clusters:
-        xml += "  <cluster>\n"
-        xml += f'    <id>{label["id"]}</id>\n'
-        xml += f'    <name>{label["name"]}</name>\n'
-        xml += f'    <description>{label["description"]}</description>\n'
-        xml += "  </cluster>\n"
-    xml += "</cluster_table>"
-    return xml
+        parts.append(
+            "  <cluster>\n"
+            f'    <id>{label["id"]}</id>\n'
+            f'    <name>{label["name"]}</name>\n'
+            f'    <description>{label["description"]}</description>\n'
+            "  </cluster>\n"
+        )
+    parts.append("</cluster_table>")
+    return "".join(parts)
+
+
+def pack_minibatches(minibatches: List[List[int]], start: int, count: int) -> List[int]:
+    """Concatenate consecutive minibatches into one batch of document indices.
+
+    Args:
+        minibatches: All minibatches of document indices
+        start: Index of the first minibatch to pack
+        count: Number of minibatches to pack
+
+    Returns:
+        List[int]: Document indices of the packed minibatches, in order
+    """
+    return [idx for minibatch in minibatches[start:start + count] for idx in minibatch]
 
 
 async def invoke_taxonomy_chain(
@@ -26,17 +26,23 @@ def main():
     print("="*80)
     print(f"\nReading Jira issues from: {csv_file}")
 
-    # Read the CSV
-    df = pd.read_csv(csv_file)
+    # Read the CSV; all columns are kept so the classified output preserves
+    # the original Jira data, but the text columns skip dtype inference
+    df = pd.read_csv(
+        csv_file,
+        dtype={'key': 'string', 'summary': 'string', 'description': 'string'},
+        engine='c'
+    )
     print(f"Loaded {len(df)} issues")
 
     # Create combined text column (summary + description)
     print("\nCombining 'summary' and 'description' columns for better context...")
-    df['combined_text'] = df.apply(
-        lambda row: f"{row['summary']}\n\n{row['description']}"
-        if pd.notna(row['description']) and str(row['description']).strip()
-        else str(row['summary']),
-        axis=1
+    summary = df['summary'].astype(str)
+    description = df['description']
+    has_description = description.notna() & description.astype(str).str.strip().ne('')
+    df['combined_text'] = summary.where(
+        ~has_description,
+        summary + "\n\n" + description.astype(str)
     )
 
     # Save preprocessed version temporarily
@@ -63,7 +69,8 @@ def main():
         verbosity=Verbosity.NORMAL,
         output_dir="./results_jira_value_streams",
         output_formats=["json", "csv", "markdown"],
-        embedding_model="text-embedding-3-large"
+        embedding_model="text-embedding-3-large",
+        cache_enabled=True  # Reruns reuse LLM responses and embeddings
     )
 
     # Run classification
@@ -80,30 +87,22 @@ def main():
         # Merge results back with original Jira data
         print("\nMerging classifications with original Jira data...")
 
-        # Convert Doc objects to DataFrame
-        result_data = [
-            {'id': doc.id, 'category': doc.category}
-            for doc in result.labeled_documents
-        ]
-        result_df = pd.DataFrame(result_data)
-
-        # Merge on the document ID (which should be the Jira key)
-        merged_df = df.merge(
-            result_df,
-            left_on='key',
-            right_on='id',
-            how='left'
+        # Convert Doc objects to a columnar DataFrame indexed by document ID
+        result_df = pd.DataFrame(
+            {'category': [doc.category for doc in result.labeled_documents]},
+            index=pd.Index([doc.id for doc in result.labeled_documents], name='key')
         )
 
-        # Drop columns that we don't need (check if they exist first)
-        cols_to_drop = []
-        if 'id' in merged_df.columns and 'id' != 'key':
-            cols_to_drop.append('id')
-        if 'combined_text' in merged_df.columns:
-            cols_to_drop.append('combined_text')
+        # Join on the document ID (which should be the Jira key), keeping
+        # the original column order
+        merged_df = (
+            df.set_index('key')
+            .join(result_df, how='left')
+            .reset_index()[[*df.columns, 'category']]
+        )
 
-        if cols_to_drop:
-            merged_df = merged_df.drop(columns=cols_to_drop)
+        # Drop the preprocessing column
+        merged_df = merged_df.drop(columns=['combined_text'])
 
         # Save enhanced CSV with classifications
         output_csv = "results_jira_value_streams/jira_issues_classified.csv"
@@ -117,13 +116,21 @@ def main():
 
         print(f"\nClassified {len(result.labeled_documents)} issues into {len(result.taxonomy)} value streams")
 
-        # Category distribution
-        from collections import Counter
-        category_counts = Counter(doc.category for doc in result.labeled_documents)
+        # Group documents by category in a single pass
+        docs_by_category = {}
+        for doc in result.labeled_documents:
+            docs_by_category.setdefault(doc.category, []).append(doc)
+
+        # Category distribution, most common first
+        category_counts = sorted(
+            ((category, len(docs)) for category, docs in docs_by_category.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
 
         print("\n📊 Distribution by Value Stream:")
         print("-" * 80)
-        for category, count in category_counts.most_common():
+        for category, count in category_counts:
             percentage = (count / len(result.labeled_documents)) * 100
             bar = "█" * int(percentage / 2)  # Simple bar chart
             print(f"{category:50s} {count:4d} ({percentage:5.1f}%) {bar}")
@@ -133,17 +140,19 @@ def main():
         print("SAMPLE CLASSIFICATIONS")
         print("="*80)
 
+        # Original Jira summaries by issue key
+        summary_by_key = dict(zip(merged_df['key'], merged_df['summary']))
+
         for category in result.taxonomy:
             cat_name = category.name
-            examples = [doc for doc in result.labeled_documents if doc.category == cat_name][:3]
+            category_docs = docs_by_category.get(cat_name, [])
+            examples = category_docs[:3]
 
             if examples:
-                print(f"\n📌 {cat_name} ({len([d for d in result.labeled_documents if d.category == cat_name])} issues)")
+                print(f"\n📌 {cat_name} ({len(category_docs)} issues)")
                 print("-" * 80)
                 for i, doc in enumerate(examples, 1):
-                    # Get the original Jira issue
-                    jira_issue = merged_df[merged_df['key'] == doc.id].iloc[0]
-                    summary = jira_issue['summary'][:100]
+                    summary = summary_by_key[doc.id][:100]
                     print(f"  {doc.id}: {summary}")
 
         print("\n" + "="*80)
@@ -48,7 +48,8 @@ def main():
         predefined_taxonomy=str(taxonomy_path),
         verbosity=Verbosity.NORMAL,
         output_dir="./results_value_streams",
-        output_formats=["json", "csv", "markdown"]
+        output_formats=["json", "csv", "markdown"],
+        cache_enabled=True  # Reruns reuse LLM responses and embeddings
     )
 
     # Run classification
@@ -65,18 +66,17 @@ def main():
 
         print(f"\nUsed {len(result.taxonomy)} value stream categories:")
         for category in result.taxonomy:
-            print(f"\n{category['id']}. {category['name']}")
-            print(f"   {category['description'][:100]}...")
+            print(f"\n{category.id}. {category.name}")
+            print(f"   {category.description[:100]}...")
 
-        print(f"\n\nLabeled {len(result.documents)} items")
+        print(f"\n\nLabeled {len(result.labeled_documents)} items")
 
-        # Category distribution
-        from collections import Counter
-        category_counts = Counter(doc['category'] for doc in result.documents)
+        # Category distribution, counted column-wise
+        category_counts = result.to_doc_table().category_counts()
 
         print("\nDistribution by Value Stream:")
-        for category, count in category_counts.most_common():
-            percentage = (count / len(result.documents)) * 100
+        for category, count in category_counts.items():
+            percentage = (count / len(result.labeled_documents)) * 100
             print(f"  {category}: {count} ({percentage:.1f}%)")
 
         # Show some examples
@@ -85,13 +85,13 @@ def main():
         print("="*80)
 
         for category in result.taxonomy:
-            cat_name = category['name']
-            examples = [doc for doc in result.documents if doc['category'] == cat_name][:2]
+            cat_name = category.name
+            examples = [doc for doc in result.labeled_documents if doc.category == cat_name][:2]
 
             if examples:
                 print(f"\n{cat_name}:")
                 for i, doc in enumerate(examples, 1):
-                    preview = doc['content'][:150].replace('\n', ' ').strip()
+                    preview = doc.content[:150].replace('\n', ' ').strip()
                     print(f"  {i}. {preview}...")
 
         print("\n" + "="*80)
@@ -2,7 +2,6 @@
 
 import pytest
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
 
 from delve.core.classifier import (
     train_classifier,
@@ -64,9 +63,9 @@ class TestClassifier:
 
             # Add small random noise
             noise = np.random.normal(0, 0.1, 3)
-            embeddings.append((base + noise).tolist())
+            embeddings.append(base + noise)
 
-        return embeddings
+        return np.asarray(embeddings, dtype=np.float16)
 
     def test_train_classifier_basic(self, sample_labeled_docs, sample_embeddings, sample_taxonomy):
         """Test basic classifier training."""
@@ -75,7 +74,7 @@ class TestClassifier:
         )
 
         # Check model type
-        assert isinstance(model, RandomForestClassifier)
+        assert hasattr(model, 'predict_proba')
 
         # Check index mapping
         assert len(index_to_category) == 3
@@ -118,7 +117,7 @@ class TestClassifier:
             docs_with_invalid[:16], sample_embeddings[:16], sample_taxonomy
         )
 
-        assert isinstance(model, RandomForestClassifier)
+        assert hasattr(model, 'predict_proba')
         assert len(index_to_category) == 3
 
     def test_train_classifier_no_valid_docs(self, sample_embeddings, sample_taxonomy):
@@ -187,6 +186,6 @@ class TestClassifier:
         # Should train successfully with class weighting
         model, index_to_category, metrics = train_classifier(docs, embeddings, sample_taxonomy)
 
-        assert isinstance(model, RandomForestClassifier)
+        assert hasattr(model, 'predict_proba')
         # Model should use balanced class weights
         assert hasattr(model, 'class_weight')
@@ -0,0 +1,95 @@
+"""Tests for the Delve client."""
+
+import pytest
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+from delve import Delve
+from delve.core import (
+    document_labeler,
+    summarizer,
+    taxonomy_generator,
+    taxonomy_reviewer,
+    taxonomy_updater,
+)
+
+_SUMMARY_PROMPT = ChatPromptTemplate.from_template(
+    "{content} {summary_length} {explanation_length}"
+)
+_TAXONOMY_PROMPT = ChatPromptTemplate.from_template(
+    "{data_xml} {cluster_table_xml} {use_case} {feedback} {max_num_clusters}"
+)
+_RESPONSE = (
+    "<summary>Reports a problem</summary><explanation>Describes a bug</explanation>"
+    "<cluster><id>1</id><name>Bug</name><description>Defects</description></cluster>"
+    "<category_id>1</category_id>"
+)
+
+
+def _fake_model(calls):
+    def respond(prompt_value):
+        calls.append(prompt_value.to_string())
+        return _RESPONSE
+
+    return RunnableLambda(respond)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Route every chat model to a stub and record the prompts it receives."""
+    calls = {"cached": [], "labeling": []}
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    for module in (summarizer, taxonomy_generator, taxonomy_updater, taxonomy_reviewer):
+        monkeypatch.setattr(module, "load_chat_model", lambda name: _fake_model(calls["cached"]))
+    monkeypatch.setattr(
+        document_labeler, "load_chat_model", lambda name: _fake_model(calls["labeling"])
+    )
+    monkeypatch.setattr(summarizer, "pull_prompt", lambda name: _SUMMARY_PROMPT)
+    monkeypatch.setattr(taxonomy_updater, "pull_prompt", lambda name: _TAXONOMY_PROMPT)
+    monkeypatch.setattr(taxonomy_reviewer, "pull_prompt", lambda name: _TAXONOMY_PROMPT)
+
+    builders = (
+        taxonomy_generator._build_taxonomy_chain,
+        taxonomy_updater._build_update_chain,
+        taxonomy_reviewer._build_review_chain,
+        document_labeler._build_classification_chain,
+    )
+    for builder in builders:
+        builder.cache_clear()
+    yield calls
+    for builder in builders:
+        builder.cache_clear()
+
+
+class TestCacheResume:
+    """Test that a cached rerun replays every cached LLM call."""
+
+    def test_rerun_without_id_column_hits_cache(self, fake_llm, tmp_path):
+        """Test that a second run over a CSV without IDs makes no cached-step LLM calls."""
+        data = tmp_path / "data.csv"
+        data.write_text(
+            "text\n"
+            "Login fails\nApp crashes on start\nAdd dark mode\n"
+            "Typo in docs\nExport is slow\nLogin fails\n"
+        )
+        delve = Delve(
+            sample_size=0,
+            batch_size=2,
+            output_dir=str(tmp_path / "results"),
+            output_formats=["json"],
+            cache_enabled=True,
+            cache_dir=str(tmp_path / "cache"),
+            seed=0,
+        )
+
+        first = delve.run_sync(str(data), text_column="text")
+        first_calls = len(fake_llm["cached"])
+        second = delve.run_sync(str(data), text_column="text")
+
+        # Summaries, generation, two updates and review all went to the model once
+        assert first_calls == 6 + 1 + 2 + 1
+        assert len(fake_llm["cached"]) == first_calls
+        assert [doc.id for doc in second.labeled_documents] == [
+            doc.id for doc in first.labeled_documents
+        ]
@@ -1,5 +1,16 @@
+import pytest
+
 from delve.configuration import Configuration
 
 
 def test_configuration_empty() -> None:
     Configuration.from_runnable_config({})
+
+
+@pytest.mark.parametrize(
+    "name", ["label_concurrency", "update_concurrency", "minibatches_per_update"]
+)
+@pytest.mark.parametrize("value", [0, -1])
+def test_configuration_rejects_non_positive_limits(name: str, value: int) -> None:
+    with pytest.raises(ValueError, match=f"{name} must be at least 1"):
+        Configuration(**{name: value})
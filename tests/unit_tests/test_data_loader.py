@@ -1,25 +1,64 @@
 """Tests for data_loader module."""
 
+import io
 import json
+import re
 import pytest
-import tempfile
-from pathlib import Path
 
+from delve.core import data_loader
 from delve.core.data_loader import _load_predefined_taxonomy
 from delve.state import Doc
 
+_ERR_MISSING_FIELDS = re.compile(r"must have 'id', 'name', and 'description'")
+_ERR_NOT_DICT = re.compile(r"must be a dict with 'id', 'name', and 'description'")
+_ERR_MISSING_COLUMNS = re.compile(r"CSV must have columns")
+_ERR_NOT_FOUND = re.compile(r"Taxonomy file not found")
+_ERR_UNSUPPORTED = re.compile(r"Unsupported file format")
+_ERR_INVALID = re.compile(r"Invalid taxonomy format")
+
+_CSV_SAMPLE = b"id,name,description\n1,Category A,Description A\n2,Category B,Description B\n"
+_CSV_MISSING_DESCRIPTION = b"id,name\n1,Category A\n"
+
+
+@pytest.fixture(scope="module")
+def sample_taxonomy():
+    """Two-category taxonomy shared by the loading tests."""
+    return [
+        {"id": "1", "name": "Category A", "description": "Description A"},
+        {"id": "2", "name": "Category B", "description": "Description B"},
+    ]
+
+
+def _to_jsonl(taxonomy):
+    return "\n".join(json.dumps(item) for item in taxonomy) + "\n"
+
+
+def _to_csv(taxonomy):
+    rows = [f"{item['id']},{item['name']},{item['description']}" for item in taxonomy]
+    return "\n".join(["id,name,description", *rows])
+
+
+def _load_csv_bytes(content, backend, monkeypatch, tmp_path):
+    """Load CSV bytes from a stream, or from a file with the given backend."""
+    if backend == "stream":
+        return _load_predefined_taxonomy(io.BytesIO(content), file_format="csv")
+    if backend == "pyarrow":
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(data_loader, "PYARROW_CSV_MIN_BYTES", 0)
+    else:
+        monkeypatch.setattr(data_loader, "pa_csv", None)
+    path = tmp_path / "taxonomy.csv"
+    path.write_bytes(content)
+    return _load_predefined_taxonomy(str(path))
+
 
 class TestLoadPredefinedTaxonomy:
     """Test the _load_predefined_taxonomy function."""
 
-    def test_load_from_list(self):
+    def test_load_from_list(self, sample_taxonomy):
         """Test loading taxonomy from a Python list."""
-        taxonomy = [
-            {"id": "1", "name": "Category A", "description": "Description A"},
-            {"id": "2", "name": "Category B", "description": "Description B"},
-        ]
-        result = _load_predefined_taxonomy(taxonomy)
-        assert result == taxonomy
+        result = _load_predefined_taxonomy(sample_taxonomy)
+        assert result == sample_taxonomy
         assert len(result) == 2
 
     def test_load_from_list_missing_fields(self):
@@ -27,116 +66,241 @@ class TestLoadPredefinedTaxonomy:
         taxonomy = [
             {"id": "1", "name": "Category A"},  # Missing description
         ]
-        with pytest.raises(ValueError, match="must have 'id', 'name', and 'description'"):
+        with pytest.raises(ValueError, match=_ERR_MISSING_FIELDS):
             _load_predefined_taxonomy(taxonomy)
 
-    def test_load_from_json_file(self):
-        """Test loading taxonomy from a JSON file."""
-        taxonomy_data = [
-            {"id": "1", "name": "Category A", "description": "Description A"},
+    @pytest.mark.parametrize(
+        "file_format,serializer",
+        [
+            ("json", json.dumps),
+            ("json", lambda taxonomy: json.dumps({"taxonomy": taxonomy})),
+            ("json", lambda taxonomy: json.dumps({"clusters": taxonomy})),
+            ("jsonl", _to_jsonl),
+            ("csv", _to_csv),
+        ],
+        ids=["json", "json_nested_taxonomy_key", "json_nested_clusters_key", "jsonl", "csv"],
+    )
+    def test_load_from_stream(self, file_format, serializer, sample_taxonomy):
+        """Test loading taxonomy from an in-memory buffer in each format."""
+        stream = io.BytesIO(serializer(sample_taxonomy).encode("utf-8"))
+
+        result = _load_predefined_taxonomy(stream, file_format=file_format)
+        assert result == sample_taxonomy
+        assert result[0]["name"] == "Category A"
+        assert result[1]["id"] == "2"
+
+    @pytest.mark.parametrize(
+        "serializer",
+        [
+            json.dumps,
+            lambda taxonomy: json.dumps({"taxonomy": taxonomy}, indent=2),
+            _to_jsonl,
+            _to_csv,
+        ],
+        ids=["json", "json_pretty_object", "jsonl", "csv"],
+    )
+    def test_load_from_stream_sniffs_format(self, serializer, sample_taxonomy):
+        """Test that a text stream without a format is sniffed as JSON, JSONL or CSV."""
+        result = _load_predefined_taxonomy(io.StringIO(serializer(sample_taxonomy)))
+        assert result == sample_taxonomy
+
+    @pytest.mark.parametrize("backend", ["json", "orjson", "simdjson"])
+    def test_json_backends_agree(self, backend, monkeypatch, tmp_path):
+        """Test that every JSON backend loads the same taxonomy."""
+        monkeypatch.setattr(data_loader, "orjson", None)
+        monkeypatch.setattr(data_loader, "simdjson", None)
+        if backend != "json":
+            monkeypatch.setattr(data_loader, backend, pytest.importorskip(backend))
+
+        taxonomy_data = {"taxonomy": {"clusters": [
+            {"id": "1", "name": "Catégorie A", "description": "Description A"},
             {"id": "2", "name": "Category B", "description": "Description B"},
+        ]}}
+        expected = taxonomy_data["taxonomy"]["clusters"]
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy_data, ensure_ascii=False), encoding="utf-8")
+
+        result = _load_predefined_taxonomy(str(path))
+        assert result == expected
+
+        # Required fields are validated on every backend
+        taxonomy_data["taxonomy"]["clusters"] = [{"id": "1", "name": "Category A"}]
+        path.write_text(json.dumps(taxonomy_data))
+        with pytest.raises(ValueError, match=_ERR_MISSING_FIELDS):
+            _load_predefined_taxonomy(str(path))
+
+    @pytest.mark.parametrize("backend", ["json", "orjson", "simdjson"])
+    @pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+    def test_json_backends_keep_value_types(self, backend, suffix, monkeypatch, tmp_path):
+        """Test that numeric and null fields come back unchanged on every backend."""
+        monkeypatch.setattr(data_loader, "orjson", None)
+        monkeypatch.setattr(data_loader, "simdjson", None)
+        if backend != "json":
+            monkeypatch.setattr(data_loader, backend, pytest.importorskip(backend))
+
+        taxonomy = [
+            {"id": 1, "name": "Category A", "description": None},
+            {"id": 2.5, "name": "Category B", "description": "Description B"},
         ]
+        path = tmp_path / f"taxonomy{suffix}"
+        path.write_text(_to_jsonl(taxonomy) if suffix == ".jsonl" else json.dumps(taxonomy))
+
+        result = _load_predefined_taxonomy(str(path))
+        assert result == taxonomy
+        assert [type(item["id"]) for item in result] == [int, float]
+        assert _load_predefined_taxonomy(io.BytesIO(path.read_bytes()), file_format=suffix) == taxonomy
+
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    def test_jsonl_backends_agree(self, backend, monkeypatch, sample_taxonomy, tmp_path):
+        """Test JSONL loading, blank lines and validation on each JSON backend."""
+        if backend == "orjson":
+            monkeypatch.setattr(data_loader, "orjson", pytest.importorskip("orjson"))
+        else:
+            monkeypatch.setattr(data_loader, "orjson", None)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(taxonomy_data, f)
-            temp_path = f.name
-
-        try:
-            result = _load_predefined_taxonomy(temp_path)
-            assert len(result) == 2
-            assert result[0]["name"] == "Category A"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_from_json_nested_taxonomy_key(self):
-        """Test loading from JSON with nested 'taxonomy' key."""
-        data = {
-            "taxonomy": [
-                {"id": "1", "name": "Category A", "description": "Description A"},
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            result = _load_predefined_taxonomy(temp_path)
-            assert len(result) == 1
-            assert result[0]["name"] == "Category A"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_from_json_nested_clusters_key(self):
-        """Test loading from JSON with nested 'clusters' key."""
-        data = {
-            "clusters": [
-                {"id": "1", "name": "Category A", "description": "Description A"},
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            result = _load_predefined_taxonomy(temp_path)
-            assert len(result) == 1
-            assert result[0]["name"] == "Category A"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_from_csv_file(self):
-        """Test loading taxonomy from a CSV file."""
-        csv_content = """id,name,description
-1,Category A,Description A
-2,Category B,Description B"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
-
-        try:
-            result = _load_predefined_taxonomy(temp_path)
-            assert len(result) == 2
-            assert result[0]["name"] == "Category A"
-            assert result[1]["id"] == "2"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_from_csv_missing_columns(self):
+        path = tmp_path / "taxonomy.jsonl"
+        path.write_text(_to_jsonl(sample_taxonomy) + "\n")
+
+        result = _load_predefined_taxonomy(str(path))
+        assert result == sample_taxonomy
+
+        path.write_text('{"id": "1", "name": "Category A"}\n')
+        with pytest.raises(ValueError, match=_ERR_MISSING_FIELDS):
+            _load_predefined_taxonomy(str(path))
+
+    @pytest.mark.parametrize(
+        "file_format,serializer", [("json", json.dumps), ("jsonl", _to_jsonl)]
+    )
+    def test_stream_matches_file_validation(self, file_format, serializer, tmp_path):
+        """Test that streamed JSON is validated and normalized like a file."""
+        taxonomy = [
+            {"id": "1", "name": "Category A", "description": "Description A", "extra": 1},
+        ]
+        path = tmp_path / f"taxonomy.{file_format}"
+        path.write_text(serializer(taxonomy))
+
+        result = _load_predefined_taxonomy(io.StringIO(serializer(taxonomy)), file_format=file_format)
+        assert result == _load_predefined_taxonomy(str(path))
+        assert result == [{"id": "1", "name": "Category A", "description": "Description A"}]
+
+        stream = io.StringIO(serializer([{"id": "1", "name": "Category A"}]))
+        with pytest.raises(ValueError, match=_ERR_MISSING_FIELDS):
+            _load_predefined_taxonomy(stream, file_format=file_format)
+
+    @pytest.mark.parametrize("backend", ["json", "orjson", "simdjson"])
+    @pytest.mark.parametrize("item", ["Category A", 1, ["1", "Category A", "Description A"]])
+    def test_non_dict_items_raise_value_error(self, backend, item, monkeypatch, tmp_path):
+        """Test that non-object categories raise ValueError for every input kind."""
+        monkeypatch.setattr(data_loader, "orjson", None)
+        monkeypatch.setattr(data_loader, "simdjson", None)
+        if backend != "json":
+            monkeypatch.setattr(data_loader, backend, pytest.importorskip(backend))
+        text = json.dumps([item])
+        path = tmp_path / "taxonomy.json"
+        path.write_text(text)
+
+        with pytest.raises(ValueError, match=_ERR_NOT_DICT):
+            _load_predefined_taxonomy([item])
+        with pytest.raises(ValueError, match=_ERR_NOT_DICT):
+            _load_predefined_taxonomy(str(path))
+        with pytest.raises(ValueError, match=_ERR_NOT_DICT):
+            _load_predefined_taxonomy(io.StringIO(text), file_format="json")
+        with pytest.raises(ValueError, match=_ERR_NOT_DICT):
+            _load_predefined_taxonomy(io.StringIO(json.dumps(item)), file_format="jsonl")
+
+    def test_load_from_csv_missing_columns(self, tmp_path):
         """Test that CSV loading fails with missing required columns."""
-        csv_content = """id,name
-1,Category A"""
+        path = tmp_path / "taxonomy.csv"
+        path.write_bytes(_CSV_MISSING_DESCRIPTION)
+
+        with pytest.raises(ValueError, match=_ERR_MISSING_COLUMNS) as exc_info:
+            _load_predefined_taxonomy(str(path))
+        assert "missing ['description']" in str(exc_info.value)
+
+    @pytest.mark.parametrize("backend", ["csv", "pyarrow"])
+    def test_csv_backends_agree(self, backend, monkeypatch, tmp_path):
+        """Test that the csv module and pyarrow readers load the same taxonomy."""
+        if backend == "pyarrow":
+            pytest.importorskip("pyarrow")
+            monkeypatch.setattr(data_loader, "PYARROW_CSV_MIN_BYTES", 0)
+        else:
+            monkeypatch.setattr(data_loader, "pa_csv", None)
+
+        path = tmp_path / "taxonomy.csv"
+        path.write_bytes(
+            b"extra,id,name,description\n"
+            b'x,01,Category A,"Description, with comma"\n'
+            b"y,2,Category B,Description B\n"
+            b"\n"
+        )
+
+        result = _load_predefined_taxonomy(str(path))
+        assert result == [
+            {"id": "01", "name": "Category A", "description": "Description, with comma"},
+            {"id": "2", "name": "Category B", "description": "Description B"},
+        ]
+
+        monkeypatch.setattr(data_loader, "PYARROW_CSV_MIN_BYTES", 0)
+        path.write_bytes(_CSV_MISSING_DESCRIPTION)
+        with pytest.raises(ValueError, match=_ERR_MISSING_COLUMNS):
+            _load_predefined_taxonomy(str(path))
+
+    @pytest.mark.parametrize("backend", ["csv", "pyarrow", "stream"])
+    def test_csv_with_byte_order_mark(self, backend, monkeypatch, tmp_path):
+        """Test that a UTF-8 BOM does not leak into the first column name."""
+        content = b"\xef\xbb\xbf" + _CSV_SAMPLE
+
+        result = _load_csv_bytes(content, backend, monkeypatch, tmp_path)
+        assert result[0] == {"id": "1", "name": "Category A", "description": "Description A"}
+
+    @pytest.mark.parametrize("backend", ["csv", "pyarrow", "stream"])
+    def test_csv_ragged_row(self, backend, monkeypatch, tmp_path):
+        """Test that a row missing fields raises ValueError instead of IndexError."""
+        content = b"id,name,description\n1,Category A,Description A\n2,Category B\n"
+
+        with pytest.raises(ValueError):
+            _load_csv_bytes(content, backend, monkeypatch, tmp_path)
+
+    def test_csv_ragged_row_reports_line(self):
+        """Test that the csv module path names the short row."""
+        content = b"id,name,description\n1,Category A,Description A\n2,Category B\n"
+
+        with pytest.raises(ValueError, match="CSV row 3 has 2 fields"):
+            _load_predefined_taxonomy(io.BytesIO(content), file_format="csv")
+
+    def test_file_results_are_memoized_and_copied(self, tmp_path):
+        """Test that repeat loads reuse the parse but hand out fresh copies."""
+        taxonomy_data = [{"id": "1", "name": "Category A", "description": "Description A"}]
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy_data))
+
+        first = _load_predefined_taxonomy(str(path))
+        first[0]["name"] = "Mutated"
+        first.append({"id": "x", "name": "Extra", "description": "Extra"})
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            temp_path = f.name
+        hits = data_loader._load_taxonomy_file.cache_info().hits
+        assert _load_predefined_taxonomy(str(path)) == taxonomy_data
+        assert data_loader._load_taxonomy_file.cache_info().hits == hits + 1
 
-        try:
-            with pytest.raises(ValueError, match="CSV must have columns"):
-                _load_predefined_taxonomy(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        # Rewriting the file invalidates the memoized result
+        taxonomy_data[0]["name"] = "Category A (renamed)"
+        path.write_text(json.dumps(taxonomy_data))
+        assert _load_predefined_taxonomy(str(path)) == taxonomy_data
 
     def test_file_not_found(self):
         """Test that loading fails when file doesn't exist."""
-        with pytest.raises(ValueError, match="Taxonomy file not found"):
+        with pytest.raises(ValueError, match=_ERR_NOT_FOUND):
             _load_predefined_taxonomy("/nonexistent/path/to/file.json")
 
-    def test_unsupported_file_format(self):
+    def test_unsupported_file_format(self, tmp_path):
         """Test that loading fails with unsupported file format."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("some content")
-            temp_path = f.name
+        path = tmp_path / "taxonomy.txt"
+        path.write_text("some content")
 
-        try:
-            with pytest.raises(ValueError, match="Unsupported file format"):
-                _load_predefined_taxonomy(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(ValueError, match=_ERR_UNSUPPORTED):
+            _load_predefined_taxonomy(str(path))
 
     def test_invalid_input_type(self):
         """Test that loading fails with invalid input type."""
-        with pytest.raises(ValueError, match="Invalid taxonomy format"):
+        with pytest.raises(ValueError, match=_ERR_INVALID):
             _load_predefined_taxonomy(123)  # type: ignore
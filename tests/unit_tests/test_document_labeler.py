@@ -0,0 +1,39 @@
+"""Tests for document_labeler module."""
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from delve.core import document_labeler
+from delve.core.document_labeler import label_documents
+from delve.state import Doc, State
+
+
+class TestLabelDocuments:
+    """Test LLM labeling of sampled documents."""
+
+    @pytest.mark.asyncio
+    async def test_taxonomy_edited_in_place_is_reformatted(self, monkeypatch):
+        """Test that a taxonomy mutated between runs reaches the prompt as edited."""
+        prompts = []
+
+        def label(inputs):
+            prompts.append(inputs["taxonomy"])
+            return {"category_id": "1"}
+
+        monkeypatch.setattr(
+            document_labeler, "_setup_classification_chain", lambda configuration: RunnableLambda(label)
+        )
+        taxonomy = [{"id": "1", "name": "Bug", "description": "Old description"}]
+        docs = [Doc(id="1", content="Login fails")]
+        config = {"configurable": {}}
+
+        await label_documents(State(documents=docs, all_documents=docs, clusters=[taxonomy]), config)
+        taxonomy[0]["description"] = "New description"
+        result = await label_documents(
+            State(documents=docs, all_documents=docs, clusters=[taxonomy]), config
+        )
+
+        assert "Old description" in prompts[0]
+        assert "New description" in prompts[1]
+        assert "Old description" not in prompts[1]
+        assert result["documents"][0].category == "Bug"
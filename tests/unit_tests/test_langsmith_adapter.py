@@ -0,0 +1,68 @@
+"""Tests for the LangSmith adapter."""
+
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from delve.adapters.langsmith_adapter import process_runs
+
+
+def _make_runs(n):
+    return [
+        SimpleNamespace(id=i, inputs={"content": f"question {i}"}, outputs=None)
+        for i in range(n)
+    ]
+
+
+class TestProcessRuns:
+    """Test single-pass run conversion and reservoir sampling."""
+
+    def test_without_sample_keeps_every_run(self):
+        """Test that all runs are converted, in order, when no sample is set."""
+        documents, num_runs = process_runs(iter(_make_runs(5)))
+
+        assert num_runs == 5
+        assert [doc.id for doc in documents] == ["0", "1", "2", "3", "4"]
+        assert "question 3" in documents[3].content
+
+    def test_sample_returns_unique_subset(self):
+        """Test that sampling keeps exactly `sample` distinct runs."""
+        random.seed(0)
+        documents, num_runs = process_runs((run for run in _make_runs(50)), sample=10)
+
+        ids = [doc.id for doc in documents]
+        assert num_runs == 50
+        assert len(ids) == 10
+        assert len(set(ids)) == 10
+        assert set(ids) <= {str(i) for i in range(50)}
+
+    def test_sample_is_reproducible_with_seed(self):
+        """Test that the same seed selects the same runs."""
+        random.seed(42)
+        first, _ = process_runs(_make_runs(30), sample=5)
+        random.seed(42)
+        second, _ = process_runs(_make_runs(30), sample=5)
+
+        assert [doc.id for doc in first] == [doc.id for doc in second]
+
+    @pytest.mark.parametrize("sample", [5, 8])
+    def test_sample_at_least_num_runs_keeps_all(self, sample):
+        """Test that a sample at least as large as the input keeps every run."""
+        documents, num_runs = process_runs(_make_runs(5), sample=sample)
+
+        assert num_runs == 5
+        assert [doc.id for doc in documents] == ["0", "1", "2", "3", "4"]
+
+    def test_sample_is_roughly_uniform(self):
+        """Test that each run is kept with probability close to sample / n."""
+        random.seed(7)
+        counts = Counter()
+        trials = 2000
+        for _ in range(trials):
+            documents, _ = process_runs(_make_runs(10), sample=3)
+            counts.update(doc.id for doc in documents)
+
+        for i in range(10):
+            assert abs(counts[str(i)] / trials - 0.3) < 0.05
@@ -0,0 +1,42 @@
+"""Tests for state module."""
+
+from delve.state import Doc, DocTable
+
+
+class TestDocTable:
+    """Test the column-oriented document table."""
+
+    def test_round_trip_preserves_docs(self):
+        """Test that converting to a table and back keeps every field."""
+        docs = [
+            Doc(id="1", content="a", summary="s1", category="Bug"),
+            Doc(id="2", content="b", explanation="e2"),
+            Doc(id="3", content="c", summary="s3", category="Feature"),
+        ]
+
+        table = DocTable.from_docs(docs)
+
+        assert len(table) == 3
+        assert table.to_docs() == docs
+
+    def test_category_counts(self):
+        """Test that counts are ordered by frequency and skip missing categories."""
+        docs = [
+            Doc(id="1", content="a", category="Bug"),
+            Doc(id="2", content="b", category="Feature"),
+            Doc(id="3", content="c", category="Feature"),
+            Doc(id="4", content="d"),
+        ]
+
+        counts = DocTable.from_docs(docs).category_counts()
+
+        assert counts == {"Feature": 2, "Bug": 1}
+        assert list(counts) == ["Feature", "Bug"]
+
+    def test_empty(self):
+        """Test that an empty document list gives an empty table."""
+        table = DocTable.from_docs([])
+
+        assert len(table) == 0
+        assert table.to_docs() == []
+        assert table.category_counts() == {}
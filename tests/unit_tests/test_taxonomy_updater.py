@@ -0,0 +1,187 @@
+"""Tests for taxonomy_updater module."""
+
+import asyncio
+
+import pytest
+
+from delve.core import taxonomy_updater
+from delve.core.taxonomy_updater import (
+    merge_taxonomies,
+    update_taxonomy,
+    update_taxonomy_parallel,
+)
+from delve.routing import route_taxonomy_updates, should_review
+from delve.state import State
+
+
+def _config(**configurable):
+    return {"configurable": configurable}
+
+
+def _fake_invoke(calls, in_flight, fail_on=None, delay=0.01):
+    """Build an invoke_taxonomy_chain stand-in that records its minibatches."""
+    async def invoke(chain, state, config, minibatch):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            if minibatch == fail_on:
+                raise RuntimeError("update failed")
+            await asyncio.sleep(delay)
+            calls.append(minibatch)
+            name = "+".join(str(i) for i in minibatch)
+            return {"clusters": [[{"id": "1", "name": name, "description": ""}]]}
+        finally:
+            in_flight["now"] -= 1
+    return invoke
+
+
+class TestMergeTaxonomies:
+    """Test merging taxonomies from parallel minibatch updates."""
+
+    def test_merges_branches_by_name_and_renumbers(self):
+        """Test that categories are deduplicated by name and renumbered."""
+        state = State(
+            clusters=[
+                [{"id": "1", "name": "Base", "description": "Initial taxonomy"}],
+                [
+                    {"id": "1", "name": "Bug", "description": "Defects"},
+                    {"id": "2", "name": "Feature", "description": "New functionality"},
+                ],
+                [
+                    {"id": "1", "name": "bug ", "description": "Duplicate of Bug"},
+                    {"id": "2", "name": "Docs", "description": "Documentation"},
+                ],
+            ]
+        )
+
+        result = merge_taxonomies(state)
+
+        assert result["clusters"] == [[
+            {"id": "1", "name": "Bug", "description": "Defects"},
+            {"id": "2", "name": "Feature", "description": "New functionality"},
+            {"id": "3", "name": "Docs", "description": "Documentation"},
+        ]]
+
+    def test_base_taxonomy_is_not_merged(self):
+        """Test that the generated base taxonomy is left out of the merge."""
+        state = State(
+            clusters=[
+                [{"id": "1", "name": "Base", "description": "Initial taxonomy"}],
+                [{"id": "1", "name": "Bug", "description": "Defects"}],
+            ]
+        )
+
+        result = merge_taxonomies(state)
+
+        assert [c["name"] for c in result["clusters"][0]] == ["Bug"]
+
+
+class TestUpdateTaxonomyParallel:
+    """Test concurrent minibatch updates."""
+
+    @pytest.fixture
+    def state(self):
+        return State(
+            minibatches=[[0], [1], [2], [3], [4]],
+            clusters=[[{"id": "1", "name": "Base", "description": ""}]],
+        )
+
+    @pytest.fixture(autouse=True)
+    def fake_chain(self, monkeypatch):
+        monkeypatch.setattr(taxonomy_updater, "_setup_update_chain", lambda configuration: None)
+
+    @pytest.mark.asyncio
+    async def test_updates_every_minibatch_in_order_within_limit(self, state, monkeypatch):
+        """Test that results follow minibatch order and respect update_concurrency."""
+        calls, in_flight = [], {"now": 0, "max": 0}
+        monkeypatch.setattr(taxonomy_updater, "invoke_taxonomy_chain", _fake_invoke(calls, in_flight))
+
+        result = await update_taxonomy_parallel(state, _config(update_concurrency=2))
+
+        assert [taxonomy[0]["name"] for taxonomy in result["clusters"]] == ["1", "2", "3", "4"]
+        assert sorted(calls) == [[1], [2], [3], [4]]
+        assert in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_packs_minibatches_per_update(self, state, monkeypatch):
+        """Test that each request covers minibatches_per_update minibatches."""
+        calls, in_flight = [], {"now": 0, "max": 0}
+        monkeypatch.setattr(taxonomy_updater, "invoke_taxonomy_chain", _fake_invoke(calls, in_flight))
+
+        result = await update_taxonomy_parallel(state, _config(minibatches_per_update=3))
+
+        assert [taxonomy[0]["name"] for taxonomy in result["clusters"]] == ["1+2+3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_outstanding_updates(self, state, monkeypatch):
+        """Test that one failed update cancels the others instead of letting them finish."""
+        calls, in_flight = [], {"now": 0, "max": 0}
+        monkeypatch.setattr(
+            taxonomy_updater,
+            "invoke_taxonomy_chain",
+            _fake_invoke(calls, in_flight, fail_on=[1], delay=0.2),
+        )
+
+        with pytest.raises(RuntimeError, match="update failed"):
+            await update_taxonomy_parallel(state, _config(update_concurrency=4))
+
+        # Give any surviving update time to finish; none should
+        await asyncio.sleep(0.3)
+        assert calls == []
+        assert in_flight["now"] == 0
+
+
+class TestSequentialUpdates:
+    """Test the update loop when several minibatches go into each request."""
+
+    @pytest.fixture(autouse=True)
+    def fake_chain(self, monkeypatch):
+        monkeypatch.setattr(taxonomy_updater, "_setup_update_chain", lambda configuration: None)
+
+    @pytest.mark.parametrize(
+        "num_updates,expected",
+        [(0, "update_taxonomy"), (1, "update_taxonomy"), (2, "review_taxonomy")],
+    )
+    def test_should_review_with_uneven_packing(self, num_updates, expected):
+        """Test that a trailing partial pack still gets its own update."""
+        state = State(
+            minibatches=[[i] for i in range(6)],
+            clusters=[[] for _ in range(1 + num_updates)],
+        )
+        assert should_review(state, _config(minibatches_per_update=4)) == expected
+
+    @pytest.mark.asyncio
+    async def test_loop_covers_every_minibatch_once(self, monkeypatch):
+        """Test that generation plus packed updates see each minibatch exactly once."""
+        calls, in_flight = [], {"now": 0, "max": 0}
+        monkeypatch.setattr(taxonomy_updater, "invoke_taxonomy_chain", _fake_invoke(calls, in_flight))
+        config = _config(minibatches_per_update=4)
+        state = State(
+            minibatches=[[i] for i in range(6)],
+            clusters=[[{"id": "1", "name": "Base", "description": ""}]],
+        )
+
+        while should_review(state, config) == "update_taxonomy":
+            result = await update_taxonomy(state, config)
+            state.clusters.extend(result["clusters"])
+
+        assert calls == [[1, 2, 3, 4], [5]]
+
+
+class TestRouteTaxonomyUpdates:
+    """Test routing between sequential and parallel updates."""
+
+    def test_sequential_by_default(self):
+        """Test that updates are sequential unless parallel_updates is set."""
+        state = State(minibatches=[[0], [1], [2]])
+        assert route_taxonomy_updates(state, _config()) == "update_taxonomy"
+
+    def test_parallel_when_enabled(self):
+        """Test that parallel_updates routes to the parallel node."""
+        state = State(minibatches=[[0], [1], [2]])
+        assert route_taxonomy_updates(state, _config(parallel_updates=True)) == "update_taxonomy_parallel"
+
+    def test_parallel_with_single_minibatch_goes_to_review(self):
+        """Test that there is nothing to update when only one minibatch exists."""
+        state = State(minibatches=[[0]])
+        assert route_taxonomy_updates(state, _config(parallel_updates=True)) == "review_taxonomy"
@@ -0,0 +1,140 @@
+"""Tests for utils module."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.prompt_values import StringPromptValue
+from langchain_core.runnables import RunnableLambda
+
+from delve.utils import CachedEmbeddings, pack_minibatches, with_response_cache
+
+
+def _counting_chain(calls):
+    async def _respond(prompt_value):
+        calls.append(prompt_value.to_string())
+        return {"answer": len(calls)}
+
+    return RunnableLambda(_respond)
+
+
+class _CountingEmbeddings(Embeddings):
+    """Embeddings stub that records which texts reach the API."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+class TestPackMinibatches:
+    """Test concatenating consecutive minibatches."""
+
+    @pytest.mark.parametrize(
+        "start,count,expected",
+        [
+            (0, 1, [0, 1]),
+            (1, 2, [2, 3, 4, 5]),
+            (2, 5, [4, 5]),
+            (3, 2, []),
+        ],
+        ids=["single", "several", "past_end", "start_past_end"],
+    )
+    def test_packs_consecutive_minibatches(self, start, count, expected):
+        """Test that indices come out in order and packing stops at the last minibatch."""
+        minibatches = [[0, 1], [2, 3], [4, 5]]
+        assert pack_minibatches(minibatches, start, count) == expected
+
+
+class TestWithResponseCache:
+    """Test the on-disk response cache around a model chain."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, tmp_path):
+        """Test that the first call reaches the chain and a repeat is served from disk."""
+        calls = []
+        chain = with_response_cache(_counting_chain(calls), "model-a", str(tmp_path))
+        prompt = StringPromptValue(text="classify this")
+
+        first = await chain.ainvoke(prompt)
+        second = await chain.ainvoke(prompt)
+
+        assert first == second == {"answer": 1}
+        assert calls == ["classify this"]
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_new_wrapper(self, tmp_path):
+        """Test that a fresh wrapper over the same directory reuses stored entries."""
+        calls = []
+        prompt = StringPromptValue(text="classify this")
+        await with_response_cache(_counting_chain(calls), "model-a", str(tmp_path)).ainvoke(prompt)
+
+        result = await with_response_cache(
+            _counting_chain(calls), "model-a", str(tmp_path)
+        ).ainvoke(prompt)
+
+        assert result == {"answer": 1}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "model_name,text",
+        [("model-b", "classify this"), ("model-a", "classify that")],
+        ids=["model_change", "prompt_change"],
+    )
+    async def test_key_change_is_a_miss(self, tmp_path, model_name, text):
+        """Test that changing the model or the rendered prompt bypasses the cache."""
+        calls = []
+        await with_response_cache(_counting_chain(calls), "model-a", str(tmp_path)).ainvoke(
+            StringPromptValue(text="classify this")
+        )
+
+        result = await with_response_cache(
+            _counting_chain(calls), model_name, str(tmp_path)
+        ).ainvoke(StringPromptValue(text=text))
+
+        assert result == {"answer": 2}
+        assert calls == ["classify this", text]
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+class TestCachedEmbeddings:
+    """Test the on-disk embedding cache."""
+
+    def test_only_misses_reach_the_client(self, tmp_path):
+        """Test that cached texts are served from disk and new ones are embedded."""
+        client = _CountingEmbeddings()
+        embeddings = CachedEmbeddings(client, "embed-a", str(tmp_path))
+
+        first = embeddings.embed_documents(["ab", "abc"])
+        second = embeddings.embed_documents(["abc", "abcd", "ab"])
+
+        assert first == [[2.0, 0.5], [3.0, 0.5]]
+        assert second == [[3.0, 0.5], [4.0, 0.5], [2.0, 0.5]]
+        assert client.calls == [["ab", "abc"], ["abcd"]]
+
+    @pytest.mark.asyncio
+    async def test_async_matches_sync_cache(self, tmp_path):
+        """Test that the async path reads and writes the same entries."""
+        client = _CountingEmbeddings()
+        embeddings = CachedEmbeddings(client, "embed-a", str(tmp_path))
+
+        assert await embeddings.aembed_documents(["ab", "abc"]) == [[2.0, 0.5], [3.0, 0.5]]
+        assert embeddings.embed_documents(["abc"]) == [[3.0, 0.5]]
+        assert await embeddings.aembed_documents(["ab"]) == [[2.0, 0.5]]
+        assert client.calls == [["ab", "abc"]]
+
+    def test_model_change_is_a_miss(self, tmp_path):
+        """Test that vectors from one model are not reused for another."""
+        client = _CountingEmbeddings()
+        CachedEmbeddings(client, "embed-a", str(tmp_path)).embed_documents(["ab"])
+        CachedEmbeddings(client, "embed-b", str(tmp_path)).embed_documents(["ab"])
+
+        assert client.calls == [["ab"], ["ab"]]